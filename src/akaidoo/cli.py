@@ -1,11 +1,14 @@
+import ast
+import io
 import re
 import sys
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
 import shlex
 import subprocess
 import os
-from git import Repo, InvalidGitRepositoryError
 
 import typer
 from manifestoo_core.odoo_series import OdooSeries
@@ -13,32 +16,82 @@ from manifestoo import echo
 import manifestoo.echo as manifestoo_echo_module
 from manifestoo.utils import print_list
 
-from .utils import (
-    get_odoo_model_stats,
-    get_timestamp,
+from .config import (
+    AGENT_INLINE_THRESHOLD,
+    LEADING_COMMENTS_RE,
+    OUTPUT_BUFFER_SIZE,
+    OUTPUT_READ_WORKERS,
+    TOKEN_FACTOR,
 )
-from .tree import print_akaidoo_tree, get_akaidoo_tree_string
-from .config import AGENT_INLINE_THRESHOLD, TOKEN_FACTOR
-from .context import (
-    resolve_akaidoo_context,
-)
-from .service import get_service
 from .banner import AKAIDOO_BANNER
 
-try:
-    from importlib import metadata
-except ImportError:
-    import importlib_metadata as metadata
 
-try:
-    import pyperclip
-except ImportError:
-    pyperclip = None
+@lru_cache(maxsize=None)
+def _pkg_version(name: str, default: str = "unknown") -> str:
+    """
+    Installed version of a distribution. importlib.metadata is slow to import
+    and to query (it scans sys.path), so this only runs for --version.
+    """
+    try:
+        from importlib import metadata
+    except ImportError:
+        import importlib_metadata as metadata
+
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return default
+
+
+def __getattr__(name: str):
+    # Resolve __version__ on first access
+    if name == "__version__":
+        return _pkg_version("akaidoo", "0.0.0-dev")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-try:
-    __version__ = metadata.version("akaidoo")
-except metadata.PackageNotFoundError:
-    __version__ = "0.0.0-dev"
+
+# Start of each file section in `git log --patch` output
+_DIFF_GIT_RE = re.compile(r"^diff --git ", re.MULTILINE)
+
+# Arguments shlex.quote() would leave untouched
+_SAFE_ARG = re.compile(r"[\w@%+=:,./-]+", re.ASCII).fullmatch
+
+
+def _shell_join(argv: List[str]) -> str:
+    """shlex.join() that skips shlex.quote() for the usual plain arguments."""
+    return " ".join(arg if _SAFE_ARG(arg) else shlex.quote(arg) for arg in argv)
+
+
+def _build_introduction(cmd_call: str, agent_mode: bool, shrink_mode: str) -> str:
+    """Preamble written before the files of an --output-file/--clipboard dump."""
+    if agent_mode:
+        introduction = f"""Role: Senior Odoo Architect enforcing OCA standards.
+Context: Secondary context file produced by akaidoo in agent mode.
+Command: {cmd_call}
+Conventions:
+1. Files start with `# FILEPATH: [path]`.
+2. Some files were filtered out to save tokens; ask for them if you need.
+3. `# shrunk` indicates method bodies removed to save tokens; ask for full content if a specific logic flow is unclear.
+4. Model extensions <= {AGENT_INLINE_THRESHOLD} lines are inlined here at full resolution.
+5. Larger expanded models are NOT in this file; their source ranges are in the agent instructions you received alongside this file.
+
+---
+"""
+
+    else:
+        introduction = f"""Role: Senior Odoo Architect enforcing OCA standards.
+Context: The following is a codebase dump produced by the akaidoo CLI.
+Command: {cmd_call}
+Conventions:
+1. Files start with `# FILEPATH: [path]`.
+2. Some files were filtered out to save tokens; ask for them if you need."""
+        if shrink_mode != "none":
+            introduction += """
+3. `# shrunk` indicates code removed to save tokens; ask for full content if a specific logic flow is unclear."""
+        if shrink_mode == "hard":
+            introduction += """
+4. Method definitions were eventually entirely skipped to save tokens and focus on the data model only."""
+    return introduction
 
 
 def parse_context_budget(budget_str: Optional[str]) -> Optional[int]:
@@ -80,22 +133,42 @@ def parse_context_budget(budget_str: Optional[str]) -> Optional[int]:
 
 def version_callback_for_run(value: bool):
     if value:
-        m_version = "unknown"
-        mc_version = "unknown"
-        try:
-            m_version = metadata.version("manifestoo")
-        except metadata.PackageNotFoundError:
-            pass
-        try:
-            mc_version = metadata.version("manifestoo-core")
-        except metadata.PackageNotFoundError:
-            pass
-        typer.echo(f"akaidoo version: {__version__}")
-        typer.echo(f"manifestoo version: {m_version}")
-        typer.echo(f"manifestoo-core version: {mc_version}")
+        typer.echo(f"akaidoo version: {_pkg_version('akaidoo', '0.0.0-dev')}")
+        typer.echo(f"manifestoo version: {_pkg_version('manifestoo')}")
+        typer.echo(f"manifestoo-core version: {_pkg_version('manifestoo-core')}")
         raise typer.Exit()
 
 
+def _iter_file_contents(
+    resolved_file_paths: List[Tuple[Path, Path]],
+    shrunken_files_content: Dict[Path, str],
+) -> Iterator[Tuple[Path, Path, Union[str, Exception]]]:
+    """
+    Yield (path, resolved path, content) in order, reading files ahead on a
+    small thread pool. A read error is yielded in place of the content.
+    """
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .utils import read_text_cached
+
+    def load(item: Tuple[Path, Path]) -> Union[str, Exception]:
+        fp, resolved = item
+        content = shrunken_files_content.get(resolved)
+        if content is not None:
+            return content
+        try:
+            return LEADING_COMMENTS_RE.sub("", read_text_cached(fp))
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=OUTPUT_READ_WORKERS) as executor:
+        for (fp, resolved), content in zip(
+            resolved_file_paths, executor.map(load, resolved_file_paths)
+        ):
+            yield fp, resolved, content
+
+
 def process_and_output_files(
     files_to_process: List[Path],
     output_file_opt: Optional[Path],
@@ -113,6 +186,10 @@ def process_and_output_files(
         raise typer.Exit()
 
     sorted_file_paths = sorted(files_to_process)
+    # Resolve each path once: the headers, the shrunken content lookups and
+    # the default listing all need the resolved form.
+    resolved_file_paths = [(fp, fp.resolve()) for fp in sorted_file_paths]
+    cwd = Path.cwd()
 
     output_actions_count = sum(
         [edit_in_editor_opt, bool(output_file_opt), clipboard_opt]
@@ -160,7 +237,9 @@ def process_and_output_files(
             echo.error(f"Failed to execute editor: {e}")
             raise typer.Exit(1)
     elif clipboard_opt:
-        if pyperclip is None:
+        try:
+            import pyperclip
+        except ImportError:
             echo.error("Clipboard requires 'pyperclip'. Install it and try again.")
             if not output_file_opt:
                 echo.warning("Fallback: File paths:")
@@ -169,29 +248,35 @@ def process_and_output_files(
                     separator_char,
                 )
             raise typer.Exit(1)
-        all_content_for_clipboard = []
-        for fp in sorted_file_paths:
+        # Assemble in one buffer rather than header + content copies per file
+        buffer = io.StringIO()
+        buffer.write(introduction)
+        separator = ""
+        for fp, resolved, content in _iter_file_contents(
+            resolved_file_paths, shrunken_files_content
+        ):
+            if isinstance(content, Exception):
+                echo.warning(f"Could not read file {fp} for clipboard: {content}")
+                continue
             try:
-                try:
-                    header_path = fp.resolve().relative_to(Path.cwd())
-                except ValueError:
-                    header_path = fp.resolve()
-                header = f"# FILEPATH: {header_path}\n"
-                content = shrunken_files_content.get(
-                    fp.resolve(),
-                    re.sub(r"^(?:#.*\n)+", "", fp.read_text(encoding="utf-8")),
-                )
-                all_content_for_clipboard.append(header + content)
-            except Exception as e:
-                echo.warning(f"Could not read file {fp} for clipboard: {e}")
+                header_path = resolved.relative_to(cwd)
+            except ValueError:
+                header_path = resolved
+            buffer.write(f"{separator}# FILEPATH: {header_path}\n")
+            buffer.write(content)
+            separator = "\n\n"
         for diff in diffs:
-            all_content_for_clipboard.append(diff)
+            buffer.write(separator)
+            buffer.write(diff)
+            separator = "\n\n"
 
-        clipboard_text = introduction + "\n\n".join(all_content_for_clipboard)
+        clipboard_text = buffer.getvalue()
+        buffer.close()
+        text_size = len(clipboard_text)
         try:
             pyperclip.copy(clipboard_text)
             print(
-                f"Content of {len(sorted_file_paths)} files ({len(clipboard_text) / 1024:.2f} KB - {len(clipboard_text) * TOKEN_FACTOR / 1000.0:.0f}k TOKENS) copied to clipboard."
+                f"Content of {len(sorted_file_paths)} files ({text_size / 1024:.2f} KB - {text_size * TOKEN_FACTOR / 1000.0:.0f}k TOKENS) copied to clipboard."
             )
         except Exception as e:  # Catch pyperclip specific errors
             echo.error(f"Clipboard operation failed: {e}")
@@ -209,29 +294,24 @@ def process_and_output_files(
         )
         total_size = 0
         try:
-            with output_file_opt.open("w", encoding="utf-8") as f:
-                f.write(introduction + "\n\n")
-                for fp in sorted_file_paths:
+            # Binary mode: each chunk is encoded once, bypassing TextIOWrapper
+            with output_file_opt.open("wb", buffering=OUTPUT_BUFFER_SIZE) as f:
+                f.write(f"{introduction}\n\n".encode("utf-8"))
+                for fp, resolved, content in _iter_file_contents(
+                    resolved_file_paths, shrunken_files_content
+                ):
+                    if isinstance(content, Exception):
+                        echo.warning(f"Could not read or write file {fp}: {content}")
+                        continue
                     try:
-                        try:
-                            header_path = fp.resolve().relative_to(Path.cwd())
-                        except ValueError:
-                            header_path = fp.resolve()
-                        header = f"# FILEPATH: {header_path}\n"
-                        content = shrunken_files_content.get(
-                            fp.resolve(),
-                            re.sub(
-                                r"^(?:#.*\n)+",
-                                "",
-                                fp.read_text(encoding="utf-8"),
-                            ),
-                        )
-                        f.write(header + content + "\n\n")
-                        total_size += len(header) + len(content) + 2
-                    except Exception as e:
-                        echo.warning(f"Could not read or write file {fp}: {e}")
+                        header_path = resolved.relative_to(cwd)
+                    except ValueError:
+                        header_path = resolved
+                    chunk = f"# FILEPATH: {header_path}\n{content}\n\n"
+                    f.write(chunk.encode("utf-8"))
+                    total_size += len(chunk)
                 for diff in diffs:
-                    f.write(diff)
+                    f.write(diff.encode("utf-8"))
                     total_size += len(diff)
             print(
                 f"Successfully wrote {total_size / 1024:.2f} KB - {total_size * TOKEN_FACTOR / 1000.0:.0f}k TOKENS to {output_file_opt}"
@@ -240,7 +320,9 @@ def process_and_output_files(
             echo.error(f"Error writing to {output_file_opt}: {e}")
             raise typer.Exit(1)
     else:  # Default: print paths
-        print_list([str(p.resolve()) for p in sorted_file_paths], separator_char)
+        print_list(
+            [str(resolved) for _, resolved in resolved_file_paths], separator_char
+        )
 
 
 akaidoo_app = typer.Typer(help="Akaidoo: win your Odoo AI context fight!")
@@ -502,6 +584,18 @@ def akaidoo_command_entrypoint(
         show_default=False,
     ),
 ):
+    # The context machinery (manifestoo addon loading, tree-sitter, process
+    # pools) is only imported when a command runs, not for --help/completion
+    from .context import resolve_akaidoo_context
+    from .service import get_service
+    from .tree import get_akaidoo_tree_string, print_akaidoo_tree
+    from .utils import (
+        get_odoo_model_stats,
+        get_timestamp,
+        read_text_cached,
+        resolve_path,
+    )
+
     manifestoo_echo_module.verbosity = (
         manifestoo_echo_module.verbosity + verbose_level_count - quiet_level_count
     )
@@ -515,6 +609,20 @@ def akaidoo_command_entrypoint(
     if context_budget and not output_file and not clipboard and not edit_in_editor:
         output_file = Path(".akaidoo/context/current.md")
 
+    # Fail fast on invalid options, before the (slow) context resolution
+    output_modes_count = sum([bool(output_file), bool(clipboard), bool(edit_in_editor)])
+    if output_modes_count > 1:
+        echo.error(
+            "Please choose only one primary output action: --output-file, --clipboard, or --edit."
+        )
+        raise typer.Exit(1)
+    if clipboard:
+        try:
+            import pyperclip
+        except ImportError:
+            echo.error("pyperclip not installed. Cannot copy to clipboard.")
+            raise typer.Exit(1)
+
     # Parse context budget
     budget_chars = parse_context_budget(context_budget)
 
@@ -538,46 +646,10 @@ def akaidoo_command_entrypoint(
         prune_methods_str=prune_methods_str,
         skip_expanded=agent_mode,
         context_budget=budget_chars,
+        # The CLI runs no other threads; the pool is still skipped otherwise
+        parallel_parsing=True,
     )
 
-    edit_mode = edit_in_editor
-    # Mutual exclusivity check
-    output_modes_count = sum([bool(output_file), bool(clipboard), bool(edit_mode)])
-    if output_modes_count > 1:
-        echo.error(
-            "Please choose only one primary output action: --output-file, --clipboard, or --edit."
-        )
-        raise typer.Exit(1)
-
-    cmd_call = shlex.join(sys.argv)
-    if agent_mode:
-        introduction = f"""Role: Senior Odoo Architect enforcing OCA standards.
-Context: Secondary context file produced by akaidoo in agent mode.
-Command: {cmd_call}
-Conventions:
-1. Files start with `# FILEPATH: [path]`.
-2. Some files were filtered out to save tokens; ask for them if you need.
-3. `# shrunk` indicates method bodies removed to save tokens; ask for full content if a specific logic flow is unclear.
-4. Model extensions <= {AGENT_INLINE_THRESHOLD} lines are inlined here at full resolution.
-5. Larger expanded models are NOT in this file; their source ranges are in the agent instructions you received alongside this file.
-
----
-"""
-
-    else:
-        introduction = f"""Role: Senior Odoo Architect enforcing OCA standards.
-Context: The following is a codebase dump produced by the akaidoo CLI.
-Command: {cmd_call}
-Conventions:
-1. Files start with `# FILEPATH: [path]`.
-2. Some files were filtered out to save tokens; ask for them if you need."""
-        if shrink_mode != "none":
-            introduction += """
-3. `# shrunk` indicates code removed to save tokens; ask for full content if a specific logic flow is unclear."""
-        if shrink_mode == "hard":
-            introduction += """
-4. Method definitions were eventually entirely skipped to save tokens and focus on the data model only."""
-
     edit_mode = edit_in_editor
     show_tree = not (output_file or clipboard or edit_mode)
     # If we are in directory mode (no selected addons), we don't show a tree
@@ -601,14 +673,14 @@ Conventions:
     model_chars_map: Dict[str, int] = {}
 
     for f in context.found_files_list:
-        abs_path = f.resolve()
+        abs_path = resolve_path(f, context.resolved_paths)
         content = context.shrunken_files_content.get(abs_path)
         info = context.shrunken_files_info.get(abs_path)
 
         # For files with expanded_locations (agent mode), calculate size from source ranges
         if info and info.get("expanded_locations"):
             try:
-                file_content = f.read_text(encoding="utf-8")
+                file_content = read_text_cached(f, context.text_cache)
                 lines = file_content.split("\n")
                 for model_name, ranges in info["expanded_locations"].items():
                     for start_line, end_line, _ in ranges:
@@ -624,7 +696,7 @@ Conventions:
         # For regular content (non-expanded models)
         if content is None:
             try:
-                content = f.read_text(encoding="utf-8")
+                content = read_text_cached(f, context.text_cache)
             except Exception:
                 content = ""
 
@@ -662,7 +734,12 @@ Conventions:
     if total_chars == 0:
         # Fallback if context_size_chars wasn't set (e.g., directory mode)
         total_chars = sum(
-            len(context.shrunken_files_content.get(f.resolve(), "")) or f.stat().st_size
+            len(
+                context.shrunken_files_content.get(
+                    resolve_path(f, context.resolved_paths), ""
+                )
+            )
+            or f.stat().st_size
             for f in context.found_files_list
         )
 
@@ -776,6 +853,9 @@ This map shows the active scope. "Pruned" modules are hidden to save focus.
 
     if output_file or clipboard:
         service = get_service()
+        introduction = _build_introduction(
+            _shell_join(sys.argv), agent_mode, shrink_mode
+        )
         dump = service.get_context_dump(context, introduction)
         if output_file:
             output_file.parent.mkdir(parents=True, exist_ok=True)
@@ -785,11 +865,8 @@ This map shows the active scope. "Pruned" modules are hidden to save focus.
                     typer.style(f"Codebase dump written to {output_file}", bold=True)
                 )
         if clipboard:
-            if pyperclip:
-                pyperclip.copy(dump)
-                typer.echo(typer.style("Codebase dump copied to clipboard.", bold=True))
-            else:
-                echo.error("pyperclip not installed. Cannot copy to clipboard.")
+            pyperclip.copy(dump)
+            typer.echo(typer.style("Codebase dump copied to clipboard.", bold=True))
 
     if agent_mode:
         locations_by_model = {}
@@ -836,7 +913,8 @@ This map shows the active scope. "Pruned" modules are hidden to save focus.
             )
         )
         typer.echo(
-            f"Context: Agent-mode context produced by akaidoo. Command: `{cmd_call}`"
+            "Context: Agent-mode context produced by akaidoo. "
+            f"Command: `{_shell_join(sys.argv)}`"
         )
         typer.echo(
             "Conventions: files in the dependency map start with `# FILEPATH: [path]`. "
@@ -903,31 +981,109 @@ This map shows the active scope. "Pruned" modules are hidden to save focus.
                     )
 
 
+def _unquote_git_path(path: str) -> str:
+    """Undo git's C-style quoting of unusual path names."""
+    if path.startswith('"') and path.endswith('"'):
+        return ast.literal_eval(f"b{path}").decode("utf-8", errors="replace")
+    return path
+
+
+def _iter_log_patches(
+    log_output: str,
+) -> Iterator[Tuple[Optional[str], Optional[str], str, str]]:
+    """
+    Split `git log --patch --format=%x00%H` output into file diffs.
+
+    Yields (a_path, b_path, change_type, patch) per file, where patch starts
+    at the first hunk (or the binary notice) and a missing side is None.
+    """
+    for commit_chunk in log_output.split("\0")[1:]:
+        for section in _DIFF_GIT_RE.split(commit_chunk)[1:]:
+            header, _, rest = section.partition("\n")
+            a_path = b_path = None
+            change_type = "M"
+            patch_lines: List[str] = []
+            lines = rest.split("\n")
+            for index, line in enumerate(lines):
+                if line.startswith(("@@", "Binary files ")):
+                    patch_lines = lines[index:]
+                    break
+                # Paths with spaces get a trailing tab on the ---/+++ lines
+                if line.startswith("--- "):
+                    source = line[4:].rstrip("\t")
+                    if source != "/dev/null":
+                        a_path = _unquote_git_path(source)[2:]
+                elif line.startswith("+++ "):
+                    target = line[4:].rstrip("\t")
+                    if target != "/dev/null":
+                        b_path = _unquote_git_path(target)[2:]
+                elif line.startswith("new file mode"):
+                    change_type = "A"
+                elif line.startswith("deleted file mode"):
+                    change_type = "D"
+                elif line.startswith("rename from "):
+                    change_type = "R"
+                    a_path = _unquote_git_path(line[12:])
+                elif line.startswith("rename to "):
+                    b_path = _unquote_git_path(line[10:])
+            if a_path is None and b_path is None:
+                # No ---/+++ lines (mode change, empty file added or
+                # deleted): "a/<path> b/<path>"
+                half = (len(header) - 1) // 2
+                a_path = b_path = _unquote_git_path(header[:half])[2:]
+                if change_type == "A":
+                    a_path = None
+                elif change_type == "D":
+                    b_path = None
+            elif change_type == "M" and (a_path is None or b_path is None):
+                change_type = "A" if a_path is None else "D"
+            yield a_path, b_path, change_type, "\n".join(patch_lines)
+
+
 def find_pr_commits_after_target(
-    diffs_list, repo_path, addon, serie, target_message=None
+    diffs_list, repo_path, addon, serie, target_message=None, max_history=None
 ):
+    # GitPython is slow to import and only needed for --migration-commits
+    from git import InvalidGitRepositoryError, Repo
+
     if target_message is None:
         target_message = f" {addon}: Migration to {serie}"
     try:
-        # Open the repository
-        repo = Repo(repo_path)
+        # Open the repository. Addons live in a sub-directory of it. Repo
+        # objects are not thread-safe, so one is opened per call.
+        repo = Repo(repo_path, search_parent_directories=True)
 
         pr_commits = []
 
-        # Find the target commit
-        target_commit = None
-        last_commits = []
-        for commit in repo.iter_commits():
-            last_commits.append(commit)
-            if target_message in commit.message:
-                target_commit = commit
-                break
-
+        # Find the target commit: let git match the message natively instead
+        # of loading every commit message into Python
+        search_rev = "HEAD"
+        if max_history:
+            # Stop the search max_history commits below HEAD
+            boundary = repo.git.rev_list("HEAD", skip=max_history, max_count=1)
+            if boundary:
+                search_rev = f"{boundary}..HEAD"
+        target_commit = next(
+            repo.iter_commits(
+                search_rev, grep=target_message, fixed_strings=True, max_count=1
+            ),
+            None,
+        )
         if target_commit is None:
-            print(f"no migration found for {addon}")
+            if max_history:
+                print(
+                    f"no migration found for {addon} in the last {max_history} commits"
+                )
+            else:
+                print(f"no migration found for {addon}")
             return
 
-        for commit in reversed(last_commits):
+        target_sha = target_commit.hexsha
+        # Only commits above the target can belong to its PR: let git bound
+        # the walk (oldest first) instead of scanning history down from HEAD
+        later_commits = repo.iter_commits(f"{target_sha}..HEAD", reverse=True)
+
+        for commit in chain((target_commit,), later_commits):
             if len(commit.parents) > 1:
                 # print(f"Found merge commit: {commit.hexsha[:8]} - likely end of PR")
                 break
@@ -937,53 +1093,49 @@ def find_pr_commits_after_target(
                 break  # for some reason commit is for another module before any merge commit
             pr_commits.append(commit)
 
-        # Display all commits in the PR
-        print(f"\nFound {len(pr_commits)} commits for {addon} v{serie} migration")
+        # Display all commits in the PR, in a single write
+        out = [f"\nFound {len(pr_commits)} commits for {addon} v{serie} migration\n"]
         for i, commit in enumerate(pr_commits):
-            print(
-                f"{i + 1}. {commit.hexsha[:8]} - {commit.author.name} - {commit.message.splitlines()[0]}"
+            out.append(
+                f"{i + 1}. {commit.hexsha[:8]} - {commit.author.name} - {commit.message.splitlines()[0]}\n"
             )
+        out.append("\n" + "=" * 80 + "\n\n")
+        sys.stdout.write("".join(out))
 
-        print("\n" + "=" * 80 + "\n")
-
-        # Show diffs for each commit in the PR after the target
-        target_index = next(
-            (
-                i
-                for i, commit in enumerate(pr_commits)
-                if commit.hexsha == target_commit.hexsha
-            ),
-            -1,
-        )
-
-        if target_index == -1:
-            print("Error: Target commit not found in PR commits list")
-            return
-
-        for i in range(target_index + 1, len(pr_commits)):
-            commit = pr_commits[i]
-            if commit.parents:
-                diff = commit.parents[0].diff(commit, create_patch=True)
-                if diff:
-                    for file_diff in diff:
-                        diff_text = f"\nFile: {file_diff.a_path} -> {file_diff.b_path}"
-                        diff_text += f"\nChange type: {file_diff.change_type}"
-                        # Decode diff if it's bytes, otherwise use as is
-                        if isinstance(file_diff.diff, bytes):
-                            diff_text += "\n" + file_diff.diff.decode(
-                                "utf-8", errors="replace"
-                            )
-                        else:
-                            diff_text += "\n" + file_diff.diff
-                    diffs_list.append(diff_text)
+        # Show diffs for each commit in the PR after the target, which is
+        # always the first one of the single oldest-first walk above
+        later_shas = [
+            commit.hexsha for commit in islice(pr_commits, 1, None) if commit.parents
+        ]
+        if later_shas:
+            # One `git log -p` for the whole PR instead of a diff per commit
+            log_output = repo.git.log(
+                *later_shas,
+                "--no-walk=unsorted",
+                "--patch",
+                "--format=%x00%H",
+                "--histogram",
+                "--find-renames",
+                "--no-color",
+                "--no-ext-diff",
+                "--src-prefix=a/",
+                "--dst-prefix=b/",
+                stdout_as_string=False,
+                strip_newline_in_stdout=False,
+            ).decode("utf-8", errors="replace")
+            for a_path, b_path, change_type, patch in _iter_log_patches(log_output):
+                diffs_list.append(
+                    f"\nFile: {a_path} -> {b_path}\nChange type: {change_type}\n{patch}"
+                )
 
     except InvalidGitRepositoryError:
-        print(f"The path '{repo_path}' is not a valid Git repository")
+        sys.stderr.write(f"The path '{repo_path}' is not a valid Git repository\n")
     except Exception as e:
-        print(f"An error occurred: {e}")
         import traceback
 
-        traceback.print_exc()
+        sys.stderr.write(f"An error occurred: {e}\n")
+        traceback.print_exc(file=sys.stderr)
+        sys.stderr.flush()
 
 
 def cli_entry_point():
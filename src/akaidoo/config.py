@@ -4,37 +4,46 @@ Akaidoo Configuration Module
 Centralizes all constants, thresholds, and configuration values used across the package.
 """
 
-from typing import Dict, List, Tuple
+import re
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 # --- Token Estimation ---
 TOKEN_FACTOR = 0.27  # Empirical factor to estimate tokens from character count
 
+# --- Dump Formatting ---
+# Leading comment block (shebang, license header) stripped from dumped files
+LEADING_COMMENTS_RE = re.compile(r"^(?:#.*\n)+")
+
 # --- Mode Definitions ---
 SHRINK_MODES: List[str] = ["none", "soft", "medium", "hard", "max"]
 
 # --- Framework Addons ---
 # These addons are excluded by default as they are part of the Odoo framework
 # and typically don't need to be included in context dumps for module development.
-FRAMEWORK_ADDONS: Tuple[str, ...] = (
-    "base",
-    "web",
-    "web_editor",
-    "web_tour",
-    "portal",
-    "mail",
-    "digest",
-    "bus",
-    "auth_signup",
-    "base_setup",
-    "http_routing",
-    "utm",
-    "uom",
-    "product",
+FRAMEWORK_ADDONS: FrozenSet[str] = frozenset(
+    {
+        "base",
+        "web",
+        "web_editor",
+        "web_tour",
+        "portal",
+        "mail",
+        "digest",
+        "bus",
+        "auth_signup",
+        "base_setup",
+        "http_routing",
+        "utm",
+        "uom",
+        "product",
+    }
 )
 
 # --- Auto-Expansion Configuration ---
 AUTO_EXPAND_THRESHOLD = 7  # Score threshold for auto-expanding models
 PARENT_CHILD_AUTO_EXPAND = True  # Whether to auto-expand parent/child (.line) models
+# Below this many model files, process pool startup costs more than it saves
+AUTO_EXPAND_PARALLEL_MIN_FILES = 64
 
 # Models that should never be auto-expanded (too generic/noisy)
 BLACKLIST_AUTO_EXPAND: Tuple[str, ...] = (
@@ -72,25 +81,54 @@ BLACKLIST_RELATION_EXPAND: Tuple[str, ...] = (
 )
 
 # --- File Scanning Configuration ---
+MANIFEST_FILE = "__manifest__.py"
+# Upper bound on addons scanned concurrently (scans are I/O bound)
+SCAN_MAX_WORKERS = 16
+
+# Addon files kept per --include content type: a file is kept when one of
+# its directories is listed for an included type and its extension matches
+# (None accepts any scanned extension). Top-level .py files go with "model".
+INCLUDE_FILE_RULES: Dict[str, Tuple[Tuple[str, ...], Optional[Tuple[str, ...]]]] = {
+    "model": (("models",), (".py",)),
+    "view": (("views",), (".xml",)),
+    "wizard": (("wizard", "wizards"), (".xml", ".py")),
+    "report": (("report", "reports"), (".xml", ".py")),
+    "data": (("data",), (".csv", ".xml")),
+    "controller": (("controllers",), (".py",)),
+    "security": (("security",), (".csv", ".xml")),
+    "static": (("static",), None),
+    "test": (("tests",), (".py",)),
+}
+
 # Binary file extensions to skip during directory scans
-BINARY_EXTS: Tuple[str, ...] = (
-    ".png",
-    ".jpg",
-    ".jpeg",
-    ".gif",
-    ".ico",
-    ".svg",
-    ".woff",
-    ".woff2",
-    ".ttf",
-    ".eot",
-    ".pdf",
-    ".map",
+BINARY_EXTS: FrozenSet[str] = frozenset(
+    {
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".gif",
+        ".ico",
+        ".svg",
+        ".woff",
+        ".woff2",
+        ".ttf",
+        ".eot",
+        ".pdf",
+        ".map",
+    }
 )
 
 # Maximum size for data files before truncation (20KB)
 MAX_DATA_FILE_SIZE = 20 * 1024
 
+# --- Output ---
+# Available addons listed when a selected addon is not found
+MAX_LISTED_AVAILABLE_ADDONS = 20
+# Write buffer used for dump files so per-file chunks are coalesced (1MB)
+OUTPUT_BUFFER_SIZE = 1024 * 1024
+# Threads reading files ahead of the writer (also caps open file descriptors)
+OUTPUT_READ_WORKERS = 8
+
 # --- Agent Mode ---
 # Expanded model classes whose source range is <= this many lines are inlined
 # directly into background.md instead of being listed as read_file instructions.
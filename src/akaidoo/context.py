@@ -5,13 +5,19 @@ Contains the AkaidooContext dataclass and all context resolution logic.
 This module is the core of akaidoo's business logic, independent of CLI specifics.
 """
 
+import heapq
 import json
+import multiprocessing
 import os
-import re
 import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 import typer
 from manifestoo import echo
@@ -26,21 +32,32 @@ from manifestoo_core.addons_set import AddonsSet
 from manifestoo_core.odoo_series import OdooSeries, detect_from_addons_set
 
 from .config import (
+    AUTO_EXPAND_PARALLEL_MIN_FILES,
     AUTO_EXPAND_THRESHOLD,
     BLACKLIST_AUTO_EXPAND,
     BLACKLIST_RELATION_EXPAND,
     BUDGET_ESCALATION_LEVELS,
     FRAMEWORK_ADDONS,
+    LEADING_COMMENTS_RE,
+    MANIFEST_FILE,
+    MAX_LISTED_AVAILABLE_ADDONS,
     PARENT_CHILD_AUTO_EXPAND,
+    SCAN_MAX_WORKERS,
     TOKEN_FACTOR,
 )
 from .scanner import (
     is_trivial_init_py,
     scan_addon_files,
     scan_directory_files,
+    walk_files,
 )
 from .shrinker import shrink_manifest
-from .utils import get_model_relations, get_odoo_model_stats
+from .utils import (
+    get_model_relations,
+    get_odoo_model_stats,
+    read_text_cached,
+    resolve_path,
+)
 
 
 @dataclass
@@ -64,6 +81,10 @@ class AkaidooContext:
     effective_shrink_mode: str = "soft"
     budget_escalation_level: int = 0
     context_size_chars: int = 0
+    # Texts read while resolving, reused by the size estimate and the dump
+    text_cache: Dict[str, str] = field(default_factory=dict, repr=False)
+    # Found file -> resolved path, shared by the size estimate and the dump
+    resolved_paths: Dict[Path, Path] = field(default_factory=dict, repr=False)
 
 
 def scan_extra_scripts(
@@ -73,18 +94,21 @@ def scan_extra_scripts(
 ) -> List[Path]:
     """Scan for OpenUpgrade and module diff scripts for an addon."""
     extra_files = []
+    # Called for every addon: only format the debug messages when shown
+    debug = manifestoo_echo_module.verbosity >= 2
     if openupgrade_path:
         ou_scripts_base_path = openupgrade_path / "openupgrade_scripts" / "scripts"
         addon_ou_script_path = ou_scripts_base_path / addon_name
         if addon_ou_script_path.is_dir():
-            echo.debug(
-                f"Scanning OpenUpgrade scripts in {addon_ou_script_path} "
-                f"for {addon_name}..."
+            if debug:
+                echo.debug(
+                    f"Scanning OpenUpgrade scripts in {addon_ou_script_path} "
+                    f"for {addon_name}..."
+                )
+            extra_files.extend(
+                Path(p).resolve() for p in walk_files(addon_ou_script_path)
             )
-            for ou_file in addon_ou_script_path.rglob("*"):
-                if ou_file.is_file():
-                    extra_files.append(ou_file.resolve())
-        else:
+        elif debug:
             echo.debug(
                 f"No OpenUpgrade script directory found for {addon_name} "
                 f"at {addon_ou_script_path}"
@@ -93,19 +117,31 @@ def scan_extra_scripts(
     if module_diff_path:
         addon_diff_path = module_diff_path / addon_name
         if addon_diff_path.is_dir():
-            echo.debug(
-                f"Scanning module diff scripts in {addon_diff_path} for {addon_name}..."
-            )
-            for diff_file in addon_diff_path.rglob("*"):
-                if diff_file.is_file():
-                    extra_files.append(diff_file.resolve())
-        else:
+            if debug:
+                echo.debug(
+                    f"Scanning module diff scripts in {addon_diff_path} for {addon_name}..."
+                )
+            extra_files.extend(Path(p).resolve() for p in walk_files(addon_diff_path))
+        elif debug:
             echo.debug(
                 f"No addon diff directory found for {addon_name} at {addon_diff_path}"
             )
     return extra_files
 
 
+def _scan_container(path: Path) -> List[str]:
+    """Return the names of the addons (dirs with a manifest) directly in path."""
+    addon_names = []
+    with os.scandir(path) as it:
+        for entry in it:
+            # is_dir() is served from d_type; symlinked addons are still followed
+            if entry.is_dir() and os.path.isfile(
+                os.path.join(entry.path, MANIFEST_FILE)
+            ):
+                addon_names.append(entry.name)
+    return addon_names
+
+
 def expand_inputs(
     addon_name_input: str,
 ) -> tuple[Set[str], Set[Path], bool, Optional[Path]]:
@@ -119,87 +155,176 @@ def expand_inputs(
     raw_inputs = comma_split(addon_name_input)
     selected_addon_names = set()
     implicit_addons_paths = set()
+    container_addons: Dict[str, List[str]] = {}
 
     # Check for forced directory mode (Mode 1)
     if len(raw_inputs) == 1:
         path_str = raw_inputs[0]
         potential_path = Path(path_str)
-        is_dir = potential_path.is_dir()
+        is_dir = os.path.isdir(path_str)
         ends_with_sep = path_str.endswith(os.path.sep)
-        has_manifest = (potential_path / "__manifest__.py").is_file()
+        has_manifest = os.path.isfile(os.path.join(path_str, MANIFEST_FILE))
 
         if is_dir and (ends_with_sep or not has_manifest):
             if ends_with_sep:
                 return set(), set(), True, potential_path
 
             # Check if container
-            has_sub_addons = any(
-                (sub / "__manifest__.py").is_file()
-                for sub in potential_path.iterdir()
-                if sub.is_dir()
-            )
-            if not has_sub_addons:
+            sub_addons = _scan_container(potential_path)
+            if not sub_addons:
                 return set(), set(), True, potential_path
+            container_addons[path_str] = sub_addons
 
     # Project/Addon Mode (Mode 2)
     for item in raw_inputs:
         path = Path(item)
-        if path.is_dir():
-            if (path / "__manifest__.py").is_file():
+        if os.path.isdir(item):
+            if os.path.isfile(os.path.join(item, MANIFEST_FILE)):
                 name = path.name
                 selected_addon_names.add(name)
                 implicit_addons_paths.add(path.parent.resolve())
             else:
-                found_any = False
-                for sub in path.iterdir():
-                    if sub.is_dir() and (sub / "__manifest__.py").is_file():
-                        selected_addon_names.add(sub.name)
-                        found_any = True
-
-                if found_any:
+                sub_addons = container_addons.get(item)
+                if sub_addons is None:
+                    sub_addons = _scan_container(path)
+                if sub_addons:
+                    selected_addon_names.update(sub_addons)
                     implicit_addons_paths.add(path.resolve())
                 else:
-                    if not found_any:
-                        selected_addon_names.add(item)
+                    selected_addon_names.add(item)
         else:
             selected_addon_names.add(item)
 
     return selected_addon_names, implicit_addons_paths, False, None
 
 
+# Dependency closures memoized per selection, for one parsed AddonsSet
+DependsMemo = Dict[FrozenSet[str], Tuple[List[str], Set[str]]]
+
+# (fingerprint, parsed AddonsSet, dependency memo)
+AddonsSetEntry = Tuple[Tuple[int, ...], AddonsSet, DependsMemo]
+
+# addons dirs -> entry, least recently used first. Bounded: the MCP server
+# may see many addons paths over its lifetime.
+_ADDONS_SET_CACHE: "OrderedDict[Tuple[str, ...], AddonsSetEntry]" = OrderedDict()
+_ADDONS_SET_CACHE_SIZE = 8
+
+
+def _addons_set_fingerprint(
+    addons_dirs: Tuple[str, ...], addons_set: AddonsSet
+) -> Tuple[int, ...]:
+    """
+    Modification times of the addons dirs and of their sub-directories
+    (addons added, removed, or gaining a manifest), and of every manifest
+    (dependencies edited). A missing path invalidates the entry.
+    """
+    fingerprint: List[int] = []
+    try:
+        for addons_dir in addons_dirs:
+            fingerprint.append(os.stat(addons_dir).st_mtime_ns)
+            with os.scandir(addons_dir) as entries:
+                fingerprint.extend(
+                    entry.stat().st_mtime_ns
+                    for entry in sorted(entries, key=lambda entry: entry.name)
+                    if entry.is_dir()
+                )
+        fingerprint.extend(
+            os.stat(addon.manifest_path).st_mtime_ns for addon in addons_set.values()
+        )
+    except OSError:
+        return ()
+    return tuple(fingerprint)
+
+
+def load_addons_set(addons_dirs: Iterable[Path]) -> Tuple[AddonsSet, DependsMemo]:
+    """
+    Return the AddonsSet of the given addons dirs and its dependency memo.
+
+    Parsing every manifest is the expensive part of a run. The result is kept
+    in memory, for the last few addons paths, and reused by budget escalation
+    re-runs and by the long-lived MCP server for as long as no addons dir or
+    manifest changes (a change within the same mtime tick goes unnoticed).
+    The returned set and memo are shared between callers: do not mutate them.
+    """
+    key = tuple(str(d) for d in addons_dirs)
+    cached = _ADDONS_SET_CACHE.get(key)
+    if cached is not None:
+        fingerprint, addons_set, depends_memo = cached
+        if fingerprint and fingerprint == _addons_set_fingerprint(key, addons_set):
+            echo.debug("Reusing parsed addons set")
+            _ADDONS_SET_CACHE.move_to_end(key)
+            return addons_set, depends_memo
+
+    addons_set = AddonsSet()
+    addons_set.add_from_addons_dirs(Path(d) for d in key)
+    depends_memo: DependsMemo = {}
+    _ADDONS_SET_CACHE[key] = (
+        _addons_set_fingerprint(key, addons_set),
+        addons_set,
+        depends_memo,
+    )
+    _ADDONS_SET_CACHE.move_to_end(key)
+    while len(_ADDONS_SET_CACHE) > _ADDONS_SET_CACHE_SIZE:
+        _ADDONS_SET_CACHE.popitem(last=False)
+    return addons_set, depends_memo
+
+
 def resolve_addons_selection(
     selected_addon_names: Set[str],
     addons_set: AddonsSet,
     excluded_addons: Set[str],
+    depends_memo: Optional[DependsMemo] = None,
 ) -> List[str]:
     """Resolve addon dependencies and return the filtered list."""
-    selection = AddonsSelection(selected_addon_names)
-    sorter = AddonSorterTopological()
-    try:
-        dependent_addons, missing = list_depends_command(
-            selection, addons_set, True, True, sorter
-        )
-    except CycleErrorExit:
-        raise typer.Exit(1)
+    memo_key = frozenset(selected_addon_names)
+    if depends_memo is not None and memo_key in depends_memo:
+        dependent_addons, missing = depends_memo[memo_key]
+    else:
+        selection = AddonsSelection(selected_addon_names)
+        sorter = AddonSorterTopological()
+        try:
+            dependent_addons, missing = list_depends_command(
+                selection, addons_set, True, True, sorter
+            )
+        except CycleErrorExit:
+            raise typer.Exit(1)
+        dependent_addons = list(dependent_addons)
+        if depends_memo is not None:
+            depends_memo[memo_key] = (dependent_addons, missing)
     if missing:
         echo.warning(f"Missing dependencies: {', '.join(sorted(missing))}")
 
-    dependent_addons_list = list(dependent_addons)
     echo.info(
-        f"{len(dependent_addons_list)} addons in dependency tree (incl. targets).",
+        f"{len(dependent_addons)} addons in dependency tree (incl. targets).",
         bold=True,
     )
     if manifestoo_echo_module.verbosity >= 2:
         echo.info("Dependency list: ", nl=False)
-        print_list(dependent_addons_list, ", ")
+        print_list(dependent_addons, ", ")
+
+    if manifestoo_echo_module.verbosity >= 1:
+        for dep_name in dependent_addons:
+            if dep_name in excluded_addons:
+                echo.info(f"Excluding addon: {dep_name}")
+    return [name for name in dependent_addons if name not in excluded_addons]
+
+
+@lru_cache(maxsize=8)
+def _addons_path_from_cfg(cfg_path: str, mtime_ns: int) -> Tuple[Path, ...]:
+    """Parse the addons_path of an Odoo cfg; cached until the file changes."""
+    m_addons_path = ManifestooAddonsPath()
+    m_addons_path.extend_from_odoo_cfg(cfg_path)
+    return tuple(m_addons_path)
+
 
-    intermediate_target_addons = []
-    for dep_name in dependent_addons_list:
-        if dep_name not in excluded_addons:
-            intermediate_target_addons.append(dep_name)
-        elif manifestoo_echo_module.verbosity >= 1:
-            echo.info(f"Excluding addon: {dep_name}")
-    return intermediate_target_addons
+def _extend_from_odoo_cfg(m_addons_path: ManifestooAddonsPath, cfg_path: str) -> None:
+    try:
+        mtime_ns = os.stat(cfg_path).st_mtime_ns
+    except OSError:
+        # Let manifestoo handle (ignore) the unreadable file as before
+        m_addons_path.extend_from_odoo_cfg(cfg_path)
+        return
+    m_addons_path.extend(_addons_path_from_cfg(cfg_path, mtime_ns))
 
 
 def resolve_addons_path(
@@ -215,17 +340,18 @@ def resolve_addons_path(
     if addons_path_from_import_odoo:
         m_addons_path.extend_from_import_odoo(addons_path_python)
     if odoo_cfg:
-        m_addons_path.extend_from_odoo_cfg(odoo_cfg)
-    elif (
-        os.environ.get("VIRTUAL_ENV")
-        and os.environ["VIRTUAL_ENV"].endswith("odoo")
-        and Path(os.environ["VIRTUAL_ENV"] + ".cfg").is_file()
-    ):
-        echo.debug(f"reading addons_path from {os.environ['VIRTUAL_ENV']}.cfg")
-        m_addons_path.extend_from_odoo_cfg(os.environ["VIRTUAL_ENV"] + ".cfg")
-    elif Path("/etc/odoo.cfg").is_file():
-        echo.debug("reading addons_path from /etc/odoo.cfg")
-        m_addons_path.extend_from_odoo_cfg("/etc/odoo.cfg")
+        _extend_from_odoo_cfg(m_addons_path, os.fspath(odoo_cfg))
+        return m_addons_path
+
+    virtual_env = os.environ.get("VIRTUAL_ENV")
+    candidates = (
+        [virtual_env + ".cfg"] if virtual_env and virtual_env.endswith("odoo") else []
+    )
+    candidates.append("/etc/odoo.cfg")
+    default_cfg = next((c for c in candidates if os.path.isfile(c)), None)
+    if default_cfg:
+        echo.debug(f"reading addons_path from {default_cfg}")
+        _extend_from_odoo_cfg(m_addons_path, default_cfg)
     return m_addons_path
 
 
@@ -325,10 +451,70 @@ def _parse_expansion_options(
     )
 
 
+def _file_model_stats(
+    path: str, text_cache: Optional[Dict[str, str]] = None
+) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Return the model stats of a Python file, or None if it can't be parsed."""
+    try:
+        return get_odoo_model_stats(read_text_cached(path, text_cache))
+    except Exception:
+        return None
+
+
+def _usable_cpu_count() -> int:
+    """CPUs this process may run on (affinity and cgroup cpusets included)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _forks_workers() -> bool:
+    """
+    Whether worker processes are forked. Spawned or forkserver workers
+    (macOS, Windows) re-import akaidoo first, which costs more than it saves.
+    """
+    method = multiprocessing.get_start_method(allow_none=True)
+    return (method or multiprocessing.get_all_start_methods()[0]) == "fork"
+
+
+def _map_model_stats(
+    paths: List[str], text_cache: Dict[str, str], parallel: bool = False
+) -> List[Optional[Dict[str, Dict[str, Any]]]]:
+    """
+    Compute _file_model_stats for each path, in order.
+
+    Parsing is CPU-bound, so with parallel=True large batches are spread over
+    a pool of forked processes. Forking a multithreaded process (MCP server,
+    live scan pools) is unsafe, so callers opt in (the CLI) and the pool is
+    only used while the main thread is the only one. Small batches,
+    single-CPU machines and platforms that do not fork by default always
+    stay in-process.
+    """
+    if (
+        parallel
+        and len(paths) >= AUTO_EXPAND_PARALLEL_MIN_FILES
+        and _usable_cpu_count() > 1
+        and _forks_workers()
+        and threading.active_count() == 1
+    ):
+        try:
+            with ProcessPoolExecutor(
+                mp_context=multiprocessing.get_context("fork")
+            ) as executor:
+                return list(executor.map(_file_model_stats, paths, chunksize=16))
+        except (OSError, RuntimeError) as e:
+            echo.debug(
+                f"Auto-expand: process pool unavailable ({e}), scanning serially"
+            )
+    return [_file_model_stats(path, text_cache) for path in paths]
+
+
 def _harvest_auto_expand_models(
     target_names: Set[str],
-    addons_set: AddonsSet,
+    addon_dirs: Dict[str, Path],
     existing_expand_set: Set[str],
+    text_cache: Dict[str, str],
+    parallel_parsing: bool = False,
 ) -> Set[str]:
     """
     Scan target addons for models that should be auto-expanded.
@@ -345,12 +531,12 @@ def _harvest_auto_expand_models(
         f"with score >= {AUTO_EXPAND_THRESHOLD}"
     )
 
+    model_files = []
     for addon_name in target_names:
-        addon_meta = addons_set.get(addon_name)
-        if not addon_meta:
+        addon_dir = addon_dirs.get(addon_name)
+        if not addon_dir:
             continue
 
-        addon_dir = addon_meta.path.resolve()
         dirs_to_scan = [
             addon_dir / "models",
             addon_dir / "wizard",
@@ -361,50 +547,59 @@ def _harvest_auto_expand_models(
             if not scan_dir.exists() or not scan_dir.is_dir():
                 continue
 
-            echo.debug(
-                f"Auto-expand: Harvesting from addon '{addon_name}' in {scan_dir}"
-            )
+            if manifestoo_echo_module.verbosity >= 2:
+                echo.debug(
+                    f"Auto-expand: Harvesting from addon '{addon_name}' in {scan_dir}"
+                )
 
-            for py_file in scan_dir.rglob("*.py"):
-                if not py_file.is_file() or "__pycache__" in py_file.parts:
-                    continue
-                try:
-                    stats = get_odoo_model_stats(py_file.read_text(encoding="utf-8"))
-                    if manifestoo_echo_module.verbosity >= 1:
-                        echo.info(
-                            f"Auto-expand: Scanning {py_file.relative_to(addon_dir)}"
-                        )
+            for py_file in walk_files(scan_dir, ".py", ("__pycache__",)):
+                model_files.append((addon_dir, py_file))
 
-                    for model_name, info in stats.items():
-                        score = info.get("score", 0)
-                        if score >= AUTO_EXPAND_THRESHOLD:
-                            if model_name not in expand_set:
-                                if model_name in BLACKLIST_AUTO_EXPAND:
-                                    if manifestoo_echo_module.verbosity >= 1:
-                                        echo.info(
-                                            f"Skipping model '{model_name}' - blacklisted"
-                                        )
-                                    continue
-                                if manifestoo_echo_module.verbosity >= 1:
-                                    echo.info(
-                                        f"Auto-expanding '{model_name}' "
-                                        f"(score: {score}, fields: {info['fields']}, "
-                                        f"methods: {info['methods']})"
-                                    )
-                                expand_set.add(model_name)
-                        elif manifestoo_echo_module.verbosity >= 1:
-                            echo.info(
-                                f"Skipping '{model_name}' - score {score} below threshold"
-                            )
-                except Exception:
-                    continue
+    all_stats = _map_model_stats(
+        [py_file for _, py_file in model_files], text_cache, parallel_parsing
+    )
+
+    if manifestoo_echo_module.verbosity < 1:
+        # Nothing to report per model: just filter on score and blacklist
+        blacklist = frozenset(BLACKLIST_AUTO_EXPAND)
+        expand_set.update(
+            model_name
+            for stats in all_stats
+            if stats
+            for model_name, info in stats.items()
+            if info.get("score", 0) >= AUTO_EXPAND_THRESHOLD
+            and model_name not in blacklist
+        )
+        return expand_set
+
+    for (addon_dir, py_file), stats in zip(model_files, all_stats):
+        if stats is None:
+            continue
+        echo.info(f"Auto-expand: Scanning {os.path.relpath(py_file, addon_dir)}")
+
+        for model_name, info in stats.items():
+            score = info.get("score", 0)
+            if score >= AUTO_EXPAND_THRESHOLD:
+                if model_name not in expand_set:
+                    if model_name in BLACKLIST_AUTO_EXPAND:
+                        echo.info(f"Skipping model '{model_name}' - blacklisted")
+                        continue
+                    echo.info(
+                        f"Auto-expanding '{model_name}' "
+                        f"(score: {score}, fields: {info['fields']}, "
+                        f"methods: {info['methods']})"
+                    )
+                    expand_set.add(model_name)
+            else:
+                echo.info(f"Skipping '{model_name}' - score {score} below threshold")
 
     return expand_set
 
 
 def _discover_model_relations(
     target_addon_names: List[str],
-    addons_set: AddonsSet,
+    addon_dirs: Dict[str, Path],
+    text_cache: Dict[str, str],
 ) -> tuple[Dict[str, Dict[str, Set[str]]], Dict[str, Set[str]], Set[str]]:
     """
     Discover all model relationships across target addons.
@@ -423,11 +618,10 @@ def _discover_model_relations(
     discovery_scan_roots = ["models", ".", "wizard", "wizards"]
 
     for addon_name in target_addon_names:
-        addon_meta = addons_set.get(addon_name)
-        if not addon_meta:
+        addon_dir = addon_dirs.get(addon_name)
+        if not addon_dir:
             continue
 
-        addon_dir = addon_meta.path.resolve()
         addon_models[addon_name] = set()
 
         for root_name in discovery_scan_roots:
@@ -435,15 +629,11 @@ def _discover_model_relations(
             if not scan_path_dir.is_dir():
                 continue
 
-            for py_file in scan_path_dir.rglob("*.py"):
-                if (
-                    not py_file.is_file()
-                    or "__pycache__" in py_file.parts
-                    or is_trivial_init_py(py_file)
-                ):
+            for py_file in walk_files(scan_path_dir, ".py", ("__pycache__",)):
+                if is_trivial_init_py(py_file):
                     continue
                 try:
-                    content = py_file.read_text(encoding="utf-8")
+                    content = read_text_cached(py_file, text_cache)
                     rels = get_model_relations(content)
                     if rels:
                         addon_models[addon_name].update(rels.keys())
@@ -554,6 +744,41 @@ def _resolve_related_models(
     return related_models_set, new_related
 
 
+def _resolve_addon_dirs(
+    addon_names: Iterable[str], addons_set: AddonsSet
+) -> Dict[str, Path]:
+    """
+    Resolved directory of each known addon. Resolving stats every path
+    component, so it is done once per addon and run, not in every pass.
+    """
+    return {
+        name: addons_set[name].path.resolve()
+        for name in addon_names
+        if name in addons_set
+    }
+
+
+def _readme_files(addon_dir: Path) -> List[Path]:
+    """
+    Return the readme/DESCRIPTION and readme/USAGE files of an addon
+    (Markdown preferred over reStructuredText), from a single scandir.
+    """
+    readme_dir = os.path.join(addon_dir, "readme")
+    try:
+        with os.scandir(readme_dir) as entries:
+            names = {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return []
+
+    readme_files = []
+    for stem in ("DESCRIPTION", "USAGE"):
+        for name in (f"{stem}.md", f"{stem}.rst"):
+            if name in names:
+                readme_files.append(addon_dir / "readme" / name)
+                break
+    return readme_files
+
+
 def resolve_akaidoo_context(
     addon_name: str,
     addons_path_str: Optional[str] = None,
@@ -574,6 +799,8 @@ def resolve_akaidoo_context(
     prune_methods_str: Optional[str] = None,
     skip_expanded: bool = False,
     context_budget: Optional[int] = None,
+    text_cache: Optional[Dict[str, str]] = None,
+    parallel_parsing: bool = False,
 ) -> AkaidooContext:
     """
     Main function to resolve the akaidoo context.
@@ -585,8 +812,15 @@ def resolve_akaidoo_context(
     4. Scanning and processing files
     5. Building the final context
 
-    Returns an AkaidooContext containing all gathered information.
+    Returns an AkaidooContext containing all gathered information. Files
+    are read at most once per call, budget escalations included, through
+    text_cache, which the returned context keeps for its dump.
+
+    parallel_parsing lets auto-expand parse model files in a process pool;
+    only pass it from a process running no other threads (the CLI).
     """
+    if text_cache is None:
+        text_cache = {}
     found_files_list: List[Path] = []
     addon_files_map: Dict[str, List[Path]] = {}
     shrunken_files_content: Dict[Path, str] = {}
@@ -661,6 +895,7 @@ def resolve_akaidoo_context(
             excluded_addons=set(),
             expand_models_set=set(),
             diffs=[],
+            text_cache=text_cache,
         )
 
     # --- Mode 2: Odoo Addon Mode (Project Mode) ---
@@ -692,9 +927,7 @@ def resolve_akaidoo_context(
     if m_addons_path:
         echo.info(str(m_addons_path), bold_intro="Using Addons path: ")
 
-    addons_set = AddonsSet()
-    if m_addons_path:
-        addons_set.add_from_addons_dirs(m_addons_path)
+    addons_set, depends_memo = load_addons_set(m_addons_path)
 
     if not addons_set:
         echo.error("No addons found in the specified addons path(s) for Odoo mode.")
@@ -712,16 +945,21 @@ def resolve_akaidoo_context(
     # Never exclude explicitly selected targets
     excluded_addons.difference_update(selected_addon_names)
 
-    missing_addons = selected_addon_names - set(addons_set.keys())
+    # AddonsSet is a dict: probe it directly rather than copying its keys
+    missing_addons = {name for name in selected_addon_names if name not in addons_set}
     if missing_addons:
+        # Large addons paths hold thousands of addons: only list the first ones
+        shown = heapq.nsmallest(MAX_LISTED_AVAILABLE_ADDONS, addons_set)
+        more = len(addons_set) - len(shown)
         echo.error(
             f"Addon(s) '{', '.join(missing_addons)}' not found in configured Odoo addons paths. "
-            f"Available: {', '.join(sorted(addons_set)) or 'None'}"
+            f"Available: {', '.join(shown) or 'None'}"
+            + (f" (+{more} more)" if more else "")
         )
         raise typer.Exit(1)
 
     intermediate_target_addons = resolve_addons_selection(
-        selected_addon_names, addons_set, excluded_addons
+        selected_addon_names, addons_set, excluded_addons, depends_memo
     )
 
     target_addon_names: List[str] = intermediate_target_addons
@@ -729,6 +967,9 @@ def resolve_akaidoo_context(
         f"Will scan files from {len(target_addon_names)} Odoo addons after all filters.",
         bold=True,
     )
+    addon_dirs = _resolve_addon_dirs(
+        chain(selected_addon_names, target_addon_names), addons_set
+    )
 
     # Initialize relevant_models as empty set for first pass
     relevant_models: Set[str] = set()
@@ -736,7 +977,11 @@ def resolve_akaidoo_context(
     # Auto-expand harvesting using helper function
     if auto_expand:
         expand_models_set = _harvest_auto_expand_models(
-            selected_addon_names, addons_set, expand_models_set
+            selected_addon_names,
+            addon_dirs,
+            expand_models_set,
+            text_cache,
+            parallel_parsing,
         )
         if manifestoo_echo_module.verbosity >= 1:
             if expand_models_set:
@@ -764,7 +1009,7 @@ def resolve_akaidoo_context(
     # --- Pass 1: Discovery (Build Model Map and Relations) ---
     pruned_addons: Dict[str, str] = {}
     all_relations, addon_models, all_discovered_models = _discover_model_relations(
-        target_addon_names, addons_set
+        target_addon_names, addon_dirs, text_cache
     )
 
     # --- Late Enrichment: Validate Parent/Child existence ---
@@ -800,10 +1045,48 @@ def resolve_akaidoo_context(
 
     # --- Pass 3: Action (Scanning, Shrinking and Filtering) ---
     processed_addons_count = 0
+    # Mirror of found_files_list for O(1) duplicate checks
+    seen_files: Set[Path] = set(found_files_list)
+
+    def add_found_file(file_path: Path) -> None:
+        if file_path not in seen_files:
+            seen_files.add(file_path)
+            found_files_list.append(file_path)
+
+    # Addon scans are dominated by directory reads and are independent of
+    # each other: run them on a thread pool, then merge in dependency order
+    # below so the output stays deterministic.
+    scan_executor = ThreadPoolExecutor(
+        max_workers=max(1, min(SCAN_MAX_WORKERS, len(target_addon_names)))
+    )
+    scan_futures: Dict[str, Future] = {}
+    extra_scripts_futures: Dict[str, Future] = {}
     for addon_to_scan_name in target_addon_names:
         addon_meta = addons_set.get(addon_to_scan_name)
         if addon_meta:
-            addon_dir = addon_meta.path.resolve()
+            addon_dir = addon_dirs[addon_to_scan_name]
+            scan_futures[addon_to_scan_name] = scan_executor.submit(
+                scan_addon_files,
+                addon_dir=addon_dir,
+                addon_name=addon_to_scan_name,
+                selected_addon_names=selected_addon_names,
+                includes=includes,
+                excluded_addons=set(),
+                shrink_mode=shrink_mode,
+                expand_models_set=expand_models_set,
+                relevant_models=relevant_models,
+                prune_methods=prune_methods_set,
+                skip_expanded=skip_expanded,
+            )
+        extra_scripts_futures[addon_to_scan_name] = scan_executor.submit(
+            scan_extra_scripts, addon_to_scan_name, openupgrade_path, module_diff_path
+        )
+    scan_executor.shutdown(wait=False)
+
+    for addon_to_scan_name in target_addon_names:
+        addon_meta = addons_set.get(addon_to_scan_name)
+        if addon_meta:
+            addon_dir = addon_dirs[addon_to_scan_name]
 
             # Pruning Decision - only check if addon is explicitly excluded
             reason = None
@@ -816,9 +1099,9 @@ def resolve_akaidoo_context(
                     echo.info(f"Pruning addon '{addon_to_scan_name}' ({reason})")
 
             # Content Gathering
-            if addon_dir.parts[-1] not in FRAMEWORK_ADDONS:
-                manifest_path = addon_dir / "__manifest__.py"
-                found_files_list.append(manifest_path)
+            if addon_dir.name not in FRAMEWORK_ADDONS:
+                manifest_path = addon_dir / MANIFEST_FILE
+                add_found_file(manifest_path)
 
                 # Shrink manifest for dependencies
                 is_dependency = addon_to_scan_name not in selected_addon_names
@@ -832,24 +1115,11 @@ def resolve_akaidoo_context(
                             f"Failed to shrink manifest for {addon_to_scan_name}: {e}"
                         )
 
-                if migration_commits and not str(addon_dir).endswith(
-                    f"/addons/{addon_to_scan_name}"
-                ):
-                    with open(manifest_path, "r", encoding="utf-8") as f:
-                        content = f.read()
-                    # manifest_dict = ast.literal_eval(content)
-                    # serie = manifest_dict.get("version").split(".")[0]
-                    # Note: find_pr_commits_after_target remains in cli.py (git-specific)
-                    # This is a known limitation - we pass diffs but don't populate it here
-
-                if (addon_dir / "readme" / "DESCRIPTION.md").is_file():
-                    found_files_list.append(addon_dir / "readme" / "DESCRIPTION.md")
-                elif (addon_dir / "readme" / "DESCRIPTION.rst").is_file():
-                    found_files_list.append(addon_dir / "readme" / "DESCRIPTION.rst")
-                if (addon_dir / "readme" / "USAGE.md").is_file():
-                    found_files_list.append(addon_dir / "readme" / "USAGE.md")
-                elif (addon_dir / "readme" / "USAGE.rst").is_file():
-                    found_files_list.append(addon_dir / "readme" / "USAGE.rst")
+                # --migration-commits: find_pr_commits_after_target remains in
+                # cli.py (git-specific), so diffs are not populated here
+
+                for readme_file in _readme_files(addon_dir):
+                    add_found_file(readme_file)
 
             processed_addons_count += 1
             if manifestoo_echo_module.verbosity >= 3:
@@ -858,18 +1128,7 @@ def resolve_akaidoo_context(
                 )
 
             # Files for the Tree
-            scan_result = scan_addon_files(
-                addon_dir=addon_dir,
-                addon_name=addon_to_scan_name,
-                selected_addon_names=selected_addon_names,
-                includes=includes,
-                excluded_addons=set(),
-                shrink_mode=shrink_mode,
-                expand_models_set=expand_models_set,
-                relevant_models=relevant_models,
-                prune_methods=prune_methods_set,
-                skip_expanded=skip_expanded,
-            )
+            scan_result = scan_futures[addon_to_scan_name].result()
             # Merge scan results into the main collections
             shrunken_files_content.update(scan_result.shrunken_content)
             shrunken_files_info.update(scan_result.shrunken_info)
@@ -879,20 +1138,16 @@ def resolve_akaidoo_context(
             # Files for the Dump
             if not reason:
                 for f in addon_files:
-                    if f not in found_files_list:
-                        found_files_list.append(f)
+                    add_found_file(f)
         else:
             echo.warning(
                 f"Odoo Addon '{addon_to_scan_name}' metadata not found, "
                 "skipping its Odoo file scan."
             )
 
-        extra_scripts = scan_extra_scripts(
-            addon_to_scan_name, openupgrade_path, module_diff_path
-        )
+        extra_scripts = extra_scripts_futures[addon_to_scan_name].result()
         for f in extra_scripts:
-            if f not in found_files_list:
-                found_files_list.append(f)
+            add_found_file(f)
 
     context = AkaidooContext(
         found_files_list=found_files_list,
@@ -909,6 +1164,7 @@ def resolve_akaidoo_context(
         enriched_additions=enriched_additions,
         new_related=new_related,
         effective_shrink_mode=shrink_mode,
+        text_cache=text_cache,
     )
 
     # Calculate and store context size
@@ -962,6 +1218,9 @@ def resolve_akaidoo_context(
                 prune_methods_str=prune_methods_str,
                 skip_expanded=skip_expanded,
                 context_budget=None,  # Don't recurse with budget
+                text_cache=text_cache,
+                # The first pass started scan threads: forking is unsafe now
+                parallel_parsing=False,
             )
             context.context_size_chars = calculate_context_size(context, skip_expanded)
             context.budget_escalation_level = current_level
@@ -998,10 +1257,11 @@ def calculate_context_size(
                                This gives a more accurate total context size.
     """
     total_size = 0
+    cwd = Path.cwd()
 
     # Size of files in found_files_list (the dump content)
     for fp in context.found_files_list:
-        abs_path = fp.resolve()
+        abs_path = resolve_path(fp, context.resolved_paths)
 
         # Get content from shrunken_files_content if available
         content = context.shrunken_files_content.get(abs_path)
@@ -1016,7 +1276,7 @@ def calculate_context_size(
                 # The expanded content will be counted by _calculate_expanded_files_size()
                 # So we just add header overhead, not file content
                 try:
-                    header_path = abs_path.relative_to(Path.cwd())
+                    header_path = abs_path.relative_to(cwd)
                 except ValueError:
                     header_path = abs_path
                 header = f"# FILEPATH: {header_path}\n"
@@ -1026,16 +1286,16 @@ def calculate_context_size(
                 # Fallback: read file directly (normal mode or no expanded content)
                 # Only strip leading comments from Python files (shebang/license)
                 try:
-                    raw_content = fp.read_text(encoding="utf-8")
+                    raw_content = read_text_cached(fp, context.text_cache)
                     if fp.suffix == ".py":
-                        content = re.sub(r"^(?:#.*\n)+", "", raw_content)
+                        content = LEADING_COMMENTS_RE.sub("", raw_content)
                     else:
                         content = raw_content
                 except Exception:
                     content = ""
 
         try:
-            header_path = abs_path.relative_to(Path.cwd())
+            header_path = abs_path.relative_to(cwd)
         except ValueError:
             header_path = abs_path
         header = f"# FILEPATH: {header_path}\n"
@@ -1088,7 +1348,7 @@ def _calculate_expanded_files_size(context: AkaidooContext) -> int:
 
         try:
             # Read the file content
-            file_content = Path(fp).read_text(encoding="utf-8")
+            file_content = read_text_cached(fp, context.text_cache)
             lines = file_content.split("\n")
         except Exception:
             continue
@@ -1125,8 +1385,9 @@ def get_akaidoo_context_dump(
     focus_files: Optional[List[str]] = None,
 ) -> str:
     """Generate the context dump string from an AkaidooContext."""
-    all_content = []
-    all_content.append(introduction)
+    # Headers, contents and separators are joined once at the end rather
+    # than concatenated per file, which would copy every file's content
+    all_content = [introduction]
 
     sorted_files = sorted(context.found_files_list)
     if focus_files:
@@ -1137,39 +1398,40 @@ def get_akaidoo_context_dump(
                 filtered_files.append(f)
         sorted_files = filtered_files
 
+    cwd = Path.cwd()
     for fp in sorted_files:
         try:
+            # Resolve once: it is needed for the header and both lookups
+            abs_path = resolve_path(fp, context.resolved_paths)
             try:
-                header_path = fp.resolve().relative_to(Path.cwd())
+                header_path = abs_path.relative_to(cwd)
             except ValueError:
-                header_path = fp.resolve()
+                header_path = abs_path
 
-            suffix = context.shrunken_files_info.get(fp.resolve(), {}).get(
-                "header_suffix", ""
-            )
+            info = context.shrunken_files_info.get(abs_path, {})
+            suffix = info.get("header_suffix", "")
             header = f"# FILEPATH: {header_path}{suffix}\n"
 
             # Get content from shrunken_files_content if available
-            content = context.shrunken_files_content.get(fp.resolve())
+            content = context.shrunken_files_content.get(abs_path)
             if content is None:
                 # In agent mode, files whose entire content was skipped
                 # (all classes are expanded models) should NOT be dumped here.
                 # They will be referenced via read_file instructions instead.
-                info = context.shrunken_files_info.get(fp.resolve(), {})
                 if info.get("content_skipped"):
                     continue
                 # Fallback: read file directly
                 # Only strip leading comments from Python files (shebang/license)
-                raw_content = fp.read_text(encoding="utf-8")
+                raw_content = read_text_cached(fp, context.text_cache)
                 if fp.suffix == ".py":
-                    content = re.sub(r"^(?:#.*\n)+", "", raw_content)
+                    content = LEADING_COMMENTS_RE.sub("", raw_content)
                 else:
                     content = raw_content
-            all_content.append(header + content)
+            all_content += ("\n\n", header, content)
         except Exception:
             continue
 
     for diff in context.diffs:
-        all_content.append(diff)
+        all_content += ("\n\n", diff)
 
-    return "\n\n".join(all_content)
+    return "".join(all_content)
@@ -1,54 +1,222 @@
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Set, Optional, Dict
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from manifestoo import echo
 import manifestoo.echo as manifestoo_echo_module
 from .shrinker import shrink_python_file
-from .types import ScanResult
+from .types import ScanResult, ShrinkResult
 from .utils import get_file_odoo_models
 from .config import (
     AGENT_INLINE_THRESHOLD,
     BINARY_EXTS,
+    INCLUDE_FILE_RULES,
+    MANIFEST_FILE,
     SHRINK_MATRIX,
     MAX_DATA_FILE_SIZE,
 )
 
 
-def is_trivial_init_py(file_path: Path) -> bool:
+@lru_cache(maxsize=2048)
+def _shrink_python_file_cached(
+    path: str, mtime_ns: int, size: int, **options: Any
+) -> ShrinkResult:
+    """
+    shrink_python_file() memoized per file version and options, so repeated
+    runs in one process (MCP server, identical re-runs) skip re-parsing.
+    Set options must be frozensets. Results are shared: don't mutate them.
+    """
+    return shrink_python_file(path, **options)
+
+
+# First non-blank line that is neither a comment nor an import
+_NONTRIVIAL_LINE_RE = re.compile(rb"^\s*(?!#|import |from )\S", re.MULTILINE)
+
+
+@lru_cache(maxsize=1024)
+def _is_trivial_init_py_cached(path: str, mtime_ns: int, size: int) -> bool:
+    with open(path, "rb") as f:
+        return _NONTRIVIAL_LINE_RE.search(f.read()) is None
+
+
+def is_trivial_init_py(file_path: Union[str, Path]) -> bool:
+    """
+    Whether an __init__.py only holds imports and comments. The (tiny) file
+    is checked with one read and a regex search, memoized per file version.
+    """
     try:
-        with file_path.open("r", encoding="utf-8") as f:
-            for line in f:
-                stripped_line = line.strip()
-                if (
-                    not stripped_line
-                    or stripped_line.startswith("#")
-                    or stripped_line.startswith("import ")
-                    or stripped_line.startswith("from ")
-                ):
-                    continue
-                return False
-        return True
+        file_stat = os.stat(file_path)
+        return _is_trivial_init_py_cached(
+            os.fspath(file_path), file_stat.st_mtime_ns, file_stat.st_size
+        )
     except Exception:
         return False
 
 
-def scan_directory_files(directory_path: Path) -> List[Path]:
-    """Scan a directory recursively, skipping pycache, i18n, hidden files, and binaries."""
-    found_files = []
-    for item in directory_path.rglob("*"):
-        if not item.is_file():
+def walk_files(
+    root: Path,
+    suffix: Union[str, Tuple[str, ...], None] = None,
+    skip_dirs: Collection[str] = (),
+) -> Iterator[str]:
+    """
+    Recursively yield the paths of the files under root, optionally only those
+    ending with suffix (a string or a tuple of strings, as for str.endswith).
+
+    Uses os.scandir so the file type comes from the directory entry instead of
+    an extra stat() per file. Directories named in skip_dirs are never entered,
+    and symlinked directories are not followed (like Path.rglob).
+    Files come in pre-order, as with Path.rglob: the files of a directory
+    before those of its sub-directories, which are walked in listing order.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        sub_dirs = []
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in skip_dirs:
+                            sub_dirs.append(entry.path)
+                    elif entry.is_file() and (
+                        suffix is None or entry.name.endswith(suffix)
+                    ):
+                        yield entry.path
+        except OSError:
             continue
+        # Reversed, so the first sub-directory is popped (walked) first
+        stack.extend(reversed(sub_dirs))
+
+
+_DIRECTORY_MODE_SKIP_NAMES = ("__pycache__", "i18n")
+
+
+def scan_directory_files(directory_path: Path) -> List[Path]:
+    """
+    Scan a directory recursively, skipping pycache, i18n, hidden files, and
+    binaries. Skipped directories are pruned instead of being walked and
+    filtered afterwards.
+    """
+    try:
+        with os.scandir(directory_path) as entries:
+            top_entries = [
+                entry
+                for entry in entries
+                if not entry.name.startswith(".")
+                and entry.name not in _DIRECTORY_MODE_SKIP_NAMES
+            ]
+    except OSError:
+        return []
+
+    # Top-level files first, then each sub-directory: the walk_files order
+    paths: List[str] = [entry.path for entry in top_entries if entry.is_file()]
+    for entry in top_entries:
+        if entry.is_dir(follow_symlinks=False):
+            paths.extend(
+                walk_files(Path(entry.path), skip_dirs=_DIRECTORY_MODE_SKIP_NAMES)
+            )
+    return [
+        Path(path)
+        for path in paths
+        if os.path.splitext(path)[1].lower() not in BINARY_EXTS
+    ]
+
+
+@lru_cache(maxsize=64)
+def _scan_plan(
+    includes: FrozenSet[str],
+) -> Tuple[FrozenSet[str], FrozenSet[str], FrozenSet[Tuple[str, str]]]:
+    """
+    Return the scan roots, the scanned extensions and the accepted
+    (directory name, extension) pairs for the included content types.
+    INCLUDE_FILE_RULES is compiled once per include set, not once per addon.
+    """
+    scan_roots = {
+        dir_name
+        for include, (dir_names, _rule_exts) in INCLUDE_FILE_RULES.items()
+        if include in includes
+        for dir_name in dir_names
+    }
+    if "model" in includes:
+        # The addon's top-level Python files
+        scan_roots.add(".")
+
+    extensions = set()
+    if includes & {"model", "controller", "test"}:
+        extensions.add(".py")
+    if includes & {"view", "wizard", "report", "data"}:
+        extensions.add(".xml")
+    if includes & {"data", "security"}:
+        extensions.add(".csv")
+    if "static" in includes:
+        extensions.add(".js")
+
+    accepted = frozenset(
+        (dir_name, ext)
+        for include, (dir_names, rule_exts) in INCLUDE_FILE_RULES.items()
+        if include in includes
+        for dir_name in dir_names
+        for ext in extensions
+        if rule_exts is None or ext in rule_exts
+    )
+    return frozenset(scan_roots), frozenset(extensions), accepted
+
+
+def _iter_scan_candidates(
+    addon_dir: Path, scan_roots: Collection[str], extensions: Collection[str]
+) -> Iterator[Tuple[str, str, str]]:
+    """
+    Yield (path, root_name, ext) for the files of the addon's scan roots.
 
-        rel = item.relative_to(directory_path)
-        if (
-            "__pycache__" in rel.parts
-            or "i18n" in rel.parts
-            or rel.parts[0].startswith(".")
-            or item.suffix.lower() in BINARY_EXTS
+    The addon directory is listed once and each scan root is walked once,
+    whatever the number of extensions: files are classified by suffix as
+    they are met. The "." root only covers the top-level Python files.
+    """
+    try:
+        with os.scandir(addon_dir) as entries:
+            top_entries = list(entries)
+    except OSError:
+        return
+
+    # Other files are rejected by str.endswith on the entry name, in C
+    suffixes = tuple(extensions)
+    for entry in top_entries:
+        if entry.is_dir():
+            if entry.name in scan_roots:
+                for path in walk_files(Path(entry.path), suffixes):
+                    yield path, entry.name, path[path.rfind(".") :]
+        elif (
+            "." in scan_roots
+            and ".py" in extensions
+            and entry.name.endswith(".py")
+            and entry.is_file()
         ):
-            continue
+            yield entry.path, ".", ".py"
+
 
-        found_files.append(item)
-    return found_files
+def _resolve_file(path: str, resolved_dirs: Dict[str, Path]) -> Path:
+    """
+    Path(path).resolve(), resolving each parent directory only once.
+    Only symlinked files still need a full resolve.
+    """
+    parent, name = os.path.split(path)
+    resolved_parent = resolved_dirs.get(parent)
+    if resolved_parent is None:
+        resolved_parent = resolved_dirs[parent] = Path(parent).resolve()
+    if os.path.islink(path):
+        return Path(path).resolve()
+    return resolved_parent / name
 
 
 def scan_addon_files(
@@ -72,6 +240,9 @@ def scan_addon_files(
     - shrunken_info: Dict mapping file paths to shrink metadata
     """
     found_files: List[Path] = []
+    seen_files: Set[Path] = set()
+    # Resolved parent directories: files share few distinct parents
+    resolved_dirs: Dict[str, Path] = {}
     shrunken_content: Dict[Path, str] = {}
     shrunken_info: Dict[Path, Dict] = {}
 
@@ -81,250 +252,155 @@ def scan_addon_files(
     excluded_addons = excluded_addons or set()
     prune_methods = prune_methods or set()
 
-    scan_roots: List[str] = []
-    if "model" in includes:
-        scan_roots.append("models")
-        scan_roots.append(".")
-    if "view" in includes:
-        scan_roots.append("views")
-    if "wizard" in includes:
-        scan_roots.extend(["wizard", "wizards"])
-    if "report" in includes:
-        scan_roots.extend(["report", "reports"])
-    if "data" in includes:
-        scan_roots.append("data")
-    if "controller" in includes:
-        scan_roots.append("controllers")
-    if "security" in includes:
-        scan_roots.append("security")
-    if "static" in includes:
-        scan_roots.append("static")
-    if "test" in includes:
-        scan_roots.append("tests")
+    scan_roots, extensions, accepted = _scan_plan(frozenset(includes))
+    if not extensions:
+        return ScanResult()
 
-    current_addon_extensions: List[str] = []
-    if "model" in includes:
-        current_addon_extensions.append(".py")
-    if "controller" in includes or "test" in includes:
-        if ".py" not in current_addon_extensions:
-            current_addon_extensions.append(".py")
-
-    if (
-        "view" in includes
-        or "wizard" in includes
-        or "report" in includes
-        or "data" in includes
-    ):
-        if ".xml" not in current_addon_extensions:
-            current_addon_extensions.append(".xml")
-    if "data" in includes or "security" in includes:
-        if ".csv" not in current_addon_extensions:
-            current_addon_extensions.append(".csv")
-    if "static" in includes:
-        if ".js" not in current_addon_extensions:
-            current_addon_extensions.append(".js")
+    addon_prefix_len = len(os.path.join(addon_dir, ""))
+    # Built once per addon rather than per file and excluded addon
+    excluded_fragments = tuple(f"/addons/{name}/" for name in excluded_addons)
 
-    if not current_addon_extensions:
-        return ScanResult()
+    # Hashable once per addon, for the shrink cache keys
+    frozen_expand_models = frozenset(expand_models_set)
+    frozen_relevant_models = frozenset(relevant_models)
+    frozen_prune_methods = frozenset(prune_methods)
 
-    for root_name in set(scan_roots):
-        scan_path_dir = addon_dir / root_name if root_name != "." else addon_dir
-        if not scan_path_dir.is_dir():
+    for file_path, root_name, ext in _iter_scan_candidates(
+        addon_dir, scan_roots, extensions
+    ):
+        # Top-level files have no directory; others are sliced out of the
+        # path string, which starts with the addon directory
+        if root_name == ".":
+            dir_parts: List[str] = []
+        else:
+            dir_parts = file_path[addon_prefix_len:].split(os.sep)[:-1]
+            # One lookup per directory instead of a test per content type
+            if not any((part, ext) in accepted for part in dir_parts):
+                continue
+        is_data_file = "data" in dir_parts and ext in (".csv", ".xml")
+
+        file_name = os.path.basename(file_path)
+        abs_file_path = _resolve_file(file_path, resolved_dirs)
+
+        is_excluded_file = excluded_fragments and any(
+            fragment in str(abs_file_path) for fragment in excluded_fragments
+        )
+        if is_excluded_file:
+            if manifestoo_echo_module.verbosity >= 3:
+                echo.info(f"Excluding file from excluded addon: {file_path}")
             continue
 
-        for ext in current_addon_extensions:
-            files_to_check: List[Path] = []
-            if root_name == ".":
-                if ext == ".py":
-                    files_to_check.extend(scan_path_dir.glob("*.py"))
-            else:
-                files_to_check.extend(scan_path_dir.glob(f"**/*{ext}"))
-
-            for found_file in files_to_check:
-                if not found_file.is_file():
-                    continue
-
-                relative_path_parts = found_file.relative_to(addon_dir).parts
-
-                is_excluded_file = any(
-                    f"/addons/{name}/" in str(found_file.resolve())
-                    for name in excluded_addons
-                )
-                if is_excluded_file:
-                    if manifestoo_echo_module.verbosity >= 3:
-                        echo.info(f"Excluding file from excluded addon: {found_file}")
-                    continue
-
-                # Determine File Type
-                is_model_file = "models" in relative_path_parts and ext == ".py"
-                is_root_py_file = (
-                    len(relative_path_parts) == 1
-                    and relative_path_parts[0].endswith(".py")
-                    and root_name == "."
-                )
-                is_view_file = "views" in relative_path_parts and ext == ".xml"
-                is_wizard_file = (
-                    "wizard" in relative_path_parts or "wizards" in relative_path_parts
-                ) and (ext == ".xml" or ext == ".py")
-                is_report_file = (
-                    "report" in relative_path_parts or "reports" in relative_path_parts
-                ) and (ext == ".xml" or ext == ".py")
-                is_data_file = ("data" in relative_path_parts) and ext in (
-                    ".csv",
-                    ".xml",
-                )
-                is_controller_file = (
-                    "controllers" in relative_path_parts and ext == ".py"
-                )
-                is_security_file = ("security" in relative_path_parts) and ext in (
-                    ".csv",
-                    ".xml",
-                )
-                is_static_file = "static" in relative_path_parts
-                is_test_file = "tests" in relative_path_parts and ext == ".py"
-
-                # Filtering
-                should_include = False
-                if "model" in includes and (is_model_file or is_root_py_file):
-                    should_include = True
-                elif "view" in includes and is_view_file:
-                    should_include = True
-                elif "wizard" in includes and is_wizard_file:
-                    should_include = True
-                elif "report" in includes and is_report_file:
-                    should_include = True
-                elif "data" in includes and is_data_file:
-                    should_include = True
-                elif "controller" in includes and is_controller_file:
-                    should_include = True
-                elif "security" in includes and is_security_file:
-                    should_include = True
-                elif "static" in includes and is_static_file:
-                    should_include = True
-                elif "test" in includes and is_test_file:
-                    should_include = True
-
-                if not should_include:
-                    continue
-
-                if found_file.name == "__init__.py" and is_trivial_init_py(found_file):
-                    echo.debug(f"  Skipping trivial __init__.py: {found_file}")
-                    continue
-
-                abs_file_path = found_file.resolve()
-                if abs_file_path not in found_files:
-                    # Large Data File Truncation
-                    if is_data_file or (ext == ".csv"):
-                        try:
-                            size = found_file.stat().st_size
-                            if size > MAX_DATA_FILE_SIZE:
-                                content = found_file.read_text(encoding="utf-8")[
-                                    :MAX_DATA_FILE_SIZE
-                                ]
-                                content += f"\n\n# ... truncated by akaidoo (size > {MAX_DATA_FILE_SIZE / 1024}KB) ..."
-                                shrunken_content[abs_file_path] = content
-                        except Exception:
-                            pass
-
-                    # Python Processing (Pruning/Shrinking)
-                    file_in_target_addon = addon_name in selected_addon_names
-                    file_models = set()
-
-                    if (
-                        found_file.suffix == ".py"
-                        and found_file.name != "__manifest__.py"
-                    ):
-                        need_models = shrink_mode != "none"
-                        if need_models:
-                            file_models = get_file_odoo_models(abs_file_path)
-
-                    if shrink_mode != "none" and found_file.suffix == ".py":
-                        if found_file.name != "__manifest__.py":
-                            file_is_expanded = any(
-                                m in expand_models_set for m in file_models
-                            )
-                            file_is_related = any(
-                                m in relevant_models for m in file_models
-                            )
+        if file_name == "__init__.py" and is_trivial_init_py(file_path):
+            if manifestoo_echo_module.verbosity >= 2:
+                echo.debug(f"  Skipping trivial __init__.py: {file_path}")
+            continue
 
+        if abs_file_path not in seen_files:
+            # Large Data File Truncation
+            if is_data_file or (ext == ".csv"):
+                try:
+                    size = os.stat(file_path).st_size
+                    if size > MAX_DATA_FILE_SIZE:
+                        # Only the kept head of the file is read
+                        with open(file_path, encoding="utf-8") as f:
+                            content = f.read(MAX_DATA_FILE_SIZE)
+                        content += f"\n\n# ... truncated by akaidoo (size > {MAX_DATA_FILE_SIZE / 1024}KB) ..."
+                        shrunken_content[abs_file_path] = content
+                except Exception:
+                    pass
+
+            # Python Processing (Pruning/Shrinking)
+            file_in_target_addon = addon_name in selected_addon_names
+            file_models = set()
+
+            if ext == ".py" and file_name != MANIFEST_FILE:
+                need_models = shrink_mode != "none"
+                if need_models:
+                    file_models = get_file_odoo_models(abs_file_path)
+
+            if shrink_mode != "none" and ext == ".py":
+                if file_name != MANIFEST_FILE:
+                    file_is_expanded = any(m in expand_models_set for m in file_models)
+                    file_is_related = any(m in relevant_models for m in file_models)
+
+                    category = "D_OTH"
+                    if file_in_target_addon:
+                        if file_is_expanded:
+                            category = "T_EXP"
+                        else:
+                            category = "T_OTH"
+                    else:
+                        if file_is_expanded:
+                            category = "D_EXP"
+                        elif file_is_related:
+                            category = "D_REL"
+                        else:
                             category = "D_OTH"
-                            if file_in_target_addon:
-                                if file_is_expanded:
-                                    category = "T_EXP"
-                                else:
-                                    category = "T_OTH"
-                            else:
-                                if file_is_expanded:
-                                    category = "D_EXP"
-                                elif file_is_related:
-                                    category = "D_REL"
-                                else:
-                                    category = "D_OTH"
-
-                            effort = shrink_mode.lower()
-                            matrix_row = SHRINK_MATRIX.get(
-                                effort, SHRINK_MATRIX["soft"]
-                            )
-                            shrink_level = matrix_row.get(category, "soft")
-
-                            # Get per-category shrink levels for proper per-model handling
-                            if file_in_target_addon:
-                                expanded_shrink_level = matrix_row.get("T_EXP", "none")
-                                related_shrink_level = matrix_row.get("T_OTH", "soft")
-                                other_shrink_level = matrix_row.get("T_OTH", "soft")
-                            else:
-                                expanded_shrink_level = matrix_row.get("D_EXP", "none")
-                                related_shrink_level = matrix_row.get("D_REL", "soft")
-                                other_shrink_level = matrix_row.get("D_OTH", "max")
-
-                            # Always run shrinker to support context headers/navigation
-                            try:
-                                header_path = abs_file_path.relative_to(Path.cwd())
-                            except ValueError:
-                                header_path = abs_file_path
-
-                            shrink_result = shrink_python_file(
-                                str(found_file),
-                                shrink_level=shrink_level,
-                                expand_models=expand_models_set,
-                                skip_imports=(shrink_mode != "none"),
-                                strip_metadata=(
-                                    shrink_level in ("hard", "max", "prune")
-                                ),
-                                relevant_models=relevant_models,
-                                prune_methods=prune_methods,
-                                header_path=str(header_path),
-                                skip_expanded_content=skip_expanded,
-                                expanded_shrink_level=expanded_shrink_level,
-                                related_shrink_level=related_shrink_level,
-                                other_shrink_level=other_shrink_level,
-                                inline_threshold=AGENT_INLINE_THRESHOLD
-                                if skip_expanded
-                                else None,
-                            )
-
-                            has_content = bool(shrink_result.content.strip())
-                            has_expanded_locs = bool(shrink_result.expanded_locations)
-
-                            # Skip files with no content AND no expanded locations
-                            if not has_content and not has_expanded_locs:
-                                continue
-
-                            # Store content only if non-empty
-                            if has_content:
-                                shrunken_content[abs_file_path] = shrink_result.content
-
-                            # Always store info if there's content OR expanded locations
-                            # (needed for token estimation in agent mode)
-                            shrunken_info[abs_file_path] = {
-                                "shrink_level": shrink_level,
-                                "expanded_models": shrink_result.expanded_models,
-                                "header_suffix": shrink_result.header_suffix or "",
-                                "expanded_locations": shrink_result.expanded_locations,
-                                "model_shrink_levels": shrink_result.model_shrink_levels,
-                                "content_skipped": shrink_result.content_skipped,
-                            }
-                    found_files.append(abs_file_path)
+
+                    effort = shrink_mode.lower()
+                    matrix_row = SHRINK_MATRIX.get(effort, SHRINK_MATRIX["soft"])
+                    shrink_level = matrix_row.get(category, "soft")
+
+                    # Get per-category shrink levels for proper per-model handling
+                    if file_in_target_addon:
+                        expanded_shrink_level = matrix_row.get("T_EXP", "none")
+                        related_shrink_level = matrix_row.get("T_OTH", "soft")
+                        other_shrink_level = matrix_row.get("T_OTH", "soft")
+                    else:
+                        expanded_shrink_level = matrix_row.get("D_EXP", "none")
+                        related_shrink_level = matrix_row.get("D_REL", "soft")
+                        other_shrink_level = matrix_row.get("D_OTH", "max")
+
+                    # Always run shrinker to support context headers/navigation
+                    try:
+                        header_path = abs_file_path.relative_to(Path.cwd())
+                    except ValueError:
+                        header_path = abs_file_path
+
+                    file_stat = os.stat(file_path)
+                    shrink_result = _shrink_python_file_cached(
+                        file_path,
+                        file_stat.st_mtime_ns,
+                        file_stat.st_size,
+                        shrink_level=shrink_level,
+                        expand_models=frozen_expand_models,
+                        skip_imports=(shrink_mode != "none"),
+                        strip_metadata=(shrink_level in ("hard", "max", "prune")),
+                        relevant_models=frozen_relevant_models,
+                        prune_methods=frozen_prune_methods,
+                        header_path=str(header_path),
+                        skip_expanded_content=skip_expanded,
+                        expanded_shrink_level=expanded_shrink_level,
+                        related_shrink_level=related_shrink_level,
+                        other_shrink_level=other_shrink_level,
+                        inline_threshold=AGENT_INLINE_THRESHOLD
+                        if skip_expanded
+                        else None,
+                    )
+
+                    has_content = bool(shrink_result.content.strip())
+                    has_expanded_locs = bool(shrink_result.expanded_locations)
+
+                    # Skip files with no content AND no expanded locations
+                    if not has_content and not has_expanded_locs:
+                        continue
+
+                    # Store content only if non-empty
+                    if has_content:
+                        shrunken_content[abs_file_path] = shrink_result.content
+
+                    # Always store info if there's content OR expanded locations
+                    # (needed for token estimation in agent mode)
+                    shrunken_info[abs_file_path] = {
+                        "shrink_level": shrink_level,
+                        "expanded_models": shrink_result.expanded_models,
+                        "header_suffix": shrink_result.header_suffix or "",
+                        "expanded_locations": shrink_result.expanded_locations,
+                        "model_shrink_levels": shrink_result.model_shrink_levels,
+                        "content_skipped": shrink_result.content_skipped,
+                    }
+            seen_files.add(abs_file_path)
+            found_files.append(abs_file_path)
 
     return ScanResult(
         found_files=found_files,
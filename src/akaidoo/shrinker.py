@@ -5,7 +5,7 @@ import ast
 import pprint
 from pathlib import Path
 from typing import Optional, Set, List, Dict, Tuple
-from .utils import _get_odoo_model_names_from_body, parser
+from .utils import _get_odoo_model_names_from_body, get_parser
 from .types import ShrinkResult
 
 
@@ -254,7 +254,7 @@ def shrink_python_file(
 
     code = Path(path).read_text(encoding="utf-8")
     code_bytes = bytes(code, "utf8")
-    tree = parser.parse(code_bytes)
+    tree = get_parser().parse(code_bytes)
     root_node = tree.root_node
 
     shrunken_parts = []
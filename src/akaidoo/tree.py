@@ -125,8 +125,9 @@ class AkaidooNode:
                 content_indent = indent + ("    " if is_last else "│   ")
 
             # 2. Path Header
+            addon_path = node.addon.path.resolve() if node.addon else None
             if node.addon and not is_pruned:
-                path_to_print = node.addon.path.resolve()
+                path_to_print = addon_path
                 try:
                     path_to_print = path_to_print.relative_to(Path.cwd())
                 except ValueError:
@@ -151,11 +152,7 @@ class AkaidooNode:
                     file_marker = "└── " if is_last_file else "├── "
 
                     try:
-                        rel_path = (
-                            f.relative_to(node.addon.path.resolve())
-                            if node.addon
-                            else f
-                        )
+                        rel_path = f.relative_to(addon_path) if addon_path else f
                     except Exception:
                         rel_path = f
 
@@ -1,12 +1,31 @@
 import datetime
-from typing import Set, Dict
+import os
+import threading
+from functools import lru_cache
+from typing import Set, Dict, FrozenSet, Optional, Union
 from pathlib import Path
 from tree_sitter import Language, Parser
 from tree_sitter_python import language as python_language
 
 # --- Parser Initialization ---
+PY_LANGUAGE = Language(python_language())
 parser = Parser()
-parser.language = Language(python_language())
+parser.language = PY_LANGUAGE
+
+# tree-sitter parsers must not be shared between threads
+_thread_parsers = threading.local()
+
+
+def get_parser() -> Parser:
+    """Return the tree-sitter Python parser of the calling thread."""
+    if threading.current_thread() is threading.main_thread():
+        return parser
+    thread_parser = getattr(_thread_parsers, "parser", None)
+    if thread_parser is None:
+        thread_parser = Parser()
+        thread_parser.language = PY_LANGUAGE
+        _thread_parsers.parser = thread_parser
+    return thread_parser
 
 
 def _get_odoo_model_names_from_body(body_node, code_bytes: bytes) -> Dict[str, str]:
@@ -72,7 +91,7 @@ def get_odoo_model_stats(code: str) -> Dict[str, Dict[str, int]]:
     Score calculation: fields=1 point, methods=3 points, 10 lines=2 points.
     """
     code_bytes = bytes(code, "utf8")
-    tree = parser.parse(code_bytes)
+    tree = get_parser().parse(code_bytes)
     root_node = tree.root_node
 
     stats = {}
@@ -137,7 +156,7 @@ def get_model_relations(code: str) -> Dict[str, Dict[str, Set[str]]]:
     to their relations: {'parents': set(), 'comodels': set()}.
     """
     code_bytes = bytes(code, "utf8")
-    tree = parser.parse(code_bytes)
+    tree = get_parser().parse(code_bytes)
     root_node = tree.root_node
 
     relations: Dict[str, Dict[str, Set[str]]] = {}
@@ -277,12 +296,50 @@ def get_model_relations(code: str) -> Dict[str, Dict[str, Set[str]]]:
     return relations
 
 
+def read_text_cached(
+    path: Union[str, Path], cache: Optional[Dict[str, str]] = None
+) -> str:
+    """
+    Read a UTF-8 text file. Given a cache (one dict per context resolution),
+    each path is read once and its text reused by the later phases.
+    """
+    path = os.fspath(path)
+    if cache is not None:
+        text = cache.get(path)
+        if text is not None:
+            return text
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    if cache is not None:
+        cache[path] = text
+    return text
+
+
+def resolve_path(path: Path, cache: Optional[Dict[Path, Path]] = None) -> Path:
+    """
+    Path.resolve(). Given a cache (one dict per context), each found file is
+    resolved once for the size estimate, the dump and the summary.
+    """
+    if cache is None:
+        return path.resolve()
+    resolved = cache.get(path)
+    if resolved is None:
+        resolved = cache[path] = path.resolve()
+    return resolved
+
+
+@lru_cache(maxsize=4096)
+def _file_odoo_models(path: str, mtime_ns: int, size: int) -> FrozenSet[str]:
+    return frozenset(get_odoo_model_stats(Path(path).read_text(encoding="utf-8")))
+
+
 def get_file_odoo_models(path: Path) -> Set[str]:
     """Read file and extract Odoo model names (Legacy helper for tree output)."""
     try:
-        content = path.read_text(encoding="utf-8")
-        stats = get_odoo_model_stats(content)
-        return set(stats.keys())
+        path_str = os.fspath(path)
+        st = os.stat(path_str)
+        # Memoized per file version: the scan and the tree both ask for it
+        return set(_file_odoo_models(path_str, st.st_mtime_ns, st.st_size))
     except Exception:
         return set()
 
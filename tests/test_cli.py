@@ -9,7 +9,11 @@ import typer  # Import Typer for creating a test app
 
 # Import the specific command function directly from your cli.py
 from akaidoo.cli import akaidoo_command_entrypoint
-from akaidoo.cli import pyperclip as actual_pyperclip_in_cli_module
+
+try:
+    import pyperclip as actual_pyperclip_in_cli_module
+except ImportError:
+    actual_pyperclip_in_cli_module = None
 
 
 def strip_ansi_codes(s: str) -> str:
@@ -422,7 +426,9 @@ def test_list_files_no_exclude_framework(dummy_addons_env):
     sys.platform == "win32", reason="Clipboard tests are tricky on Windows CI"
 )
 def test_list_files_clipboard(dummy_addons_env, mocker):
-    mock_pyperclip_module_patch = mocker.patch("akaidoo.cli.pyperclip", create=True)
+    # The CLI imports pyperclip only when --clipboard is given
+    mock_pyperclip_module_patch = mocker.MagicMock()
+    mocker.patch.dict(sys.modules, {"pyperclip": mock_pyperclip_module_patch})
 
     if not hasattr(mock_pyperclip_module_patch, "copy"):
         mock_pyperclip_module_patch.copy = mocker.Mock()
@@ -569,6 +575,20 @@ def test_list_files_missing_addon(dummy_addons_env):
     assert "Addon(s) 'non_existent_addon' not found" in result.processed_stderr
 
 
+def test_list_files_missing_addon_caps_available_list(dummy_addons_env, mocker):
+    mocker.patch("akaidoo.context.MAX_LISTED_AVAILABLE_ADDONS", 1)
+    args = [
+        "non_existent_addon",
+        "-c",
+        str(dummy_addons_env["odoo_conf"]),
+        "--no-addons-path-from-import-odoo",
+    ]
+    result = _run_cli(args, expected_exit_code=1)
+    stderr = " ".join(result.processed_stderr.split())
+    assert "Available: addon_a (+" in stderr
+    assert "addon_b" not in stderr
+
+
 def test_trivial_init_skipping(dummy_addons_env):
     args = [
         "addon_a",
@@ -593,7 +613,9 @@ def test_trivial_init_skipping(dummy_addons_env):
 
 
 def test_list_files_shrink_option(dummy_addons_env, mocker):
-    mock_pyperclip_module_patch = mocker.patch("akaidoo.cli.pyperclip", create=True)
+    # The CLI imports pyperclip only when --clipboard is given
+    mock_pyperclip_module_patch = mocker.MagicMock()
+    mocker.patch.dict(sys.modules, {"pyperclip": mock_pyperclip_module_patch})
 
     if not hasattr(mock_pyperclip_module_patch, "copy"):
         mock_pyperclip_module_patch.copy = mocker.Mock()
@@ -1344,3 +1366,111 @@ def test_agent_mode_file_count_consistency(odoo_models_env, tmp_path):
     assert (
         normal_files == agent_files
     ), f"File counts differ: normal={normal_files}, agent={agent_files}"
+
+
+@pytest.fixture
+def migration_repo(tmp_path):
+    """Git repository of my_addon: its migration commit, then a fix commit."""
+    import subprocess
+
+    def git(*args):
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    git("init", "-q")
+    git("config", "user.email", "dev@example.com")
+    git("config", "user.name", "Dev")
+    addon_dir = tmp_path / "my_addon"
+    addon_dir.mkdir()
+    (addon_dir / "a.py").write_text("a = 1\n")
+    git("add", ".")
+    git("commit", "-qm", "[MIG] my_addon: Migration to 16.0")
+    (addon_dir / "a.py").write_text("a = 2\n")
+    (addon_dir / "b.py").write_text("b = 1\n")
+    git("add", ".")
+    git("commit", "-qm", "[FIX] my_addon: fix a, add b")
+    return {"addon_dir": addon_dir, "git": git}
+
+
+def test_find_pr_commits_after_target_keeps_every_file_diff(migration_repo):
+    from akaidoo.cli import find_pr_commits_after_target
+
+    diffs = []
+    find_pr_commits_after_target(diffs, migration_repo["addon_dir"], "my_addon", "16")
+
+    assert len(diffs) == 2
+    assert "my_addon/a.py" in diffs[0] and "+a = 2" in diffs[0]
+    assert "my_addon/b.py" in diffs[1] and "+b = 1" in diffs[1]
+
+
+def test_find_pr_commits_after_target_empty_files(migration_repo):
+    from akaidoo.cli import find_pr_commits_after_target
+
+    git, addon_dir = migration_repo["git"], migration_repo["addon_dir"]
+    (addon_dir / "empty.py").write_text("")
+    git("add", ".")
+    git("commit", "-qm", "[FIX] my_addon: add empty.py")
+    git("rm", "-q", "my_addon/empty.py")
+    git("commit", "-qm", "[FIX] my_addon: remove empty.py")
+
+    diffs = []
+    find_pr_commits_after_target(diffs, addon_dir, "my_addon", "16")
+
+    assert len(diffs) == 4
+    assert diffs[2].startswith("\nFile: None -> my_addon/empty.py\nChange type: A\n")
+    assert diffs[3].startswith("\nFile: my_addon/empty.py -> None\nChange type: D\n")
+
+
+def test_find_pr_commits_after_target_max_history(migration_repo, capsys):
+    from akaidoo.cli import find_pr_commits_after_target
+
+    addon_dir = migration_repo["addon_dir"]
+    diffs = []
+    find_pr_commits_after_target(diffs, addon_dir, "my_addon", "16", max_history=1)
+    assert diffs == []
+    assert "no migration found for my_addon in the last 1 commits" in (
+        capsys.readouterr().out
+    )
+
+    find_pr_commits_after_target(diffs, addon_dir, "my_addon", "16", max_history=2)
+    assert len(diffs) == 2 and "+a = 2" in diffs[0]
+    assert "Found 2 commits for my_addon v16 migration" in capsys.readouterr().out
+
+
+def test_conflicting_output_modes_fail_before_resolving(mocker):
+    resolve = mocker.patch("akaidoo.context.resolve_akaidoo_context")
+    result = _run_cli(
+        ["addon_a", "--clipboard", "--edit", "--no-addons-path-from-import-odoo"],
+        expected_exit_code=1,
+    )
+    assert "Please choose only one primary output action" in result.processed_stderr
+    resolve.assert_not_called()
+
+
+def test_process_and_output_files_writes_dump(tmp_path, monkeypatch):
+    from akaidoo.cli import process_and_output_files
+
+    monkeypatch.chdir(tmp_path)
+    plain = tmp_path / "a.py"
+    plain.write_text("# License header\n# more\na = 1\n")
+    shrunk = tmp_path / "b.py"
+    shrunk.write_text("class B:\n    def f(self):\n        return 1\n")
+    output = tmp_path / "out" / "dump.txt"
+
+    process_and_output_files(
+        [shrunk, plain],
+        output_file_opt=output,
+        clipboard_opt=False,
+        edit_in_editor_opt=False,
+        editor_command_str_opt=None,
+        separator_char="\n",
+        shrunken_files_content={shrunk.resolve(): "class B:\n    pass\n"},
+        diffs=["DIFF"],
+        introduction="INTRO",
+    )
+
+    assert output.read_text(encoding="utf-8") == (
+        "INTRO\n\n"
+        "# FILEPATH: a.py\na = 1\n\n\n"
+        "# FILEPATH: b.py\nclass B:\n    pass\n\n\n"
+        "DIFF"
+    )
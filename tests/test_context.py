@@ -0,0 +1,143 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from akaidoo.config import AUTO_EXPAND_PARALLEL_MIN_FILES
+from akaidoo.context import (
+    _ADDONS_SET_CACHE,
+    _ADDONS_SET_CACHE_SIZE,
+    _map_model_stats,
+    load_addons_set,
+    resolve_addons_path,
+)
+
+
+def _make_addon(addons_dir: Path, name: str, depends=()):
+    addon_dir = addons_dir / name
+    addon_dir.mkdir()
+    (addon_dir / "__init__.py").write_text("")
+    (addon_dir / "__manifest__.py").write_text(
+        f"{{'name': '{name}', 'version': '16.0.1.0.0', 'depends': {list(depends)!r}}}"
+    )
+    return addon_dir
+
+
+def _touch_later(path: Path):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def test_load_addons_set_reuses_until_changed(tmp_path: Path):
+    _make_addon(tmp_path, "a")
+    addon_b = _make_addon(tmp_path, "b", ["a"])
+
+    addons_set, depends_memo = load_addons_set([tmp_path])
+    assert set(addons_set) == {"a", "b"}
+    assert load_addons_set([tmp_path])[0] is addons_set
+
+    # Editing a manifest invalidates the parsed set and its dependency memo
+    (addon_b / "__manifest__.py").write_text(
+        "{'name': 'b', 'version': '16.0.1.0.0', 'depends': []}"
+    )
+    _touch_later(addon_b / "__manifest__.py")
+    reloaded, reloaded_memo = load_addons_set([tmp_path])
+    assert reloaded is not addons_set
+    assert reloaded["b"].manifest.depends == []
+    assert reloaded_memo is not depends_memo
+
+    # Adding an addon changes the addons dir itself
+    _make_addon(tmp_path, "c")
+    _touch_later(tmp_path)
+    assert set(load_addons_set([tmp_path])[0]) == {"a", "b", "c"}
+
+    # A directory that gains a manifest only changes that sub-directory
+    (tmp_path / "d").mkdir()
+    _touch_later(tmp_path)
+    assert set(load_addons_set([tmp_path])[0]) == {"a", "b", "c"}
+    (tmp_path / "d" / "__init__.py").write_text("")
+    (tmp_path / "d" / "__manifest__.py").write_text(
+        "{'name': 'd', 'version': '16.0.1.0.0', 'depends': []}"
+    )
+    _touch_later(tmp_path / "d")
+    assert "d" in load_addons_set([tmp_path])[0]
+
+
+def test_load_addons_set_keeps_the_last_addons_paths(tmp_path: Path):
+    addons_dirs = []
+    for i in range(_ADDONS_SET_CACHE_SIZE + 1):
+        addons_dir = tmp_path / f"addons{i}"
+        addons_dir.mkdir()
+        _make_addon(addons_dir, f"a{i}")
+        addons_dirs.append(addons_dir)
+
+    first = load_addons_set([addons_dirs[0]])[0]
+    for addons_dir in addons_dirs[1:]:
+        load_addons_set([addons_dir])
+    assert len(_ADDONS_SET_CACHE) <= _ADDONS_SET_CACHE_SIZE
+    # The least recently used addons path was evicted and is parsed again
+    assert load_addons_set([addons_dirs[0]])[0] is not first
+
+
+def test_resolve_addons_path_rereads_changed_cfg(tmp_path: Path):
+    cfg = tmp_path / "odoo.cfg"
+    cfg.write_text("[options]\naddons_path = /a,/b\n")
+    assert resolve_addons_path(None, False, "python", cfg) == [Path("/a"), Path("/b")]
+    assert resolve_addons_path(None, False, "python", cfg) == [Path("/a"), Path("/b")]
+
+    cfg.write_text("[options]\naddons_path = /c\n")
+    _touch_later(cfg)
+    assert resolve_addons_path("/x", False, "python", cfg) == [Path("/x"), Path("/c")]
+
+
+def test_map_model_stats_uses_process_pool_only_when_asked(tmp_path: Path, mocker):
+    paths = []
+    for i in range(AUTO_EXPAND_PARALLEL_MIN_FILES):
+        path = tmp_path / f"m{i}.py"
+        path.write_text("x = 1\n")
+        paths.append(str(path))
+    pool = mocker.patch("akaidoo.context.ProcessPoolExecutor")
+    mocker.patch("akaidoo.context._usable_cpu_count", return_value=4)
+    forks = mocker.patch("akaidoo.context._forks_workers", return_value=False)
+
+    text_cache = {}
+    assert len(_map_model_stats(paths, text_cache)) == len(paths)
+    pool.assert_not_called()
+    assert set(text_cache) == set(paths)
+
+    # Spawned workers would re-import akaidoo: stay in-process
+    assert len(_map_model_stats(paths, {}, parallel=True)) == len(paths)
+    pool.assert_not_called()
+
+    forks.return_value = True
+    _map_model_stats(paths, {}, parallel=True)
+    pool.assert_called_once()
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="needs the fork start method",
+)
+def test_map_model_stats_parallel_matches_serial(tmp_path: Path, mocker):
+    paths = []
+    for i in range(AUTO_EXPAND_PARALLEL_MIN_FILES):
+        path = tmp_path / f"m{i}.py"
+        path.write_text(
+            "from odoo import fields, models\n\n\n"
+            f"class M{i}(models.Model):\n"
+            f"    _name = 'm.{i}'\n\n"
+            "    name = fields.Char()\n"
+        )
+        paths.append(str(path))
+    pool = mocker.patch(
+        "akaidoo.context.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+    )
+    mocker.patch("akaidoo.context._usable_cpu_count", return_value=2)
+    mocker.patch("akaidoo.context._forks_workers", return_value=True)
+
+    parallel = _map_model_stats(paths, {}, parallel=True)
+    pool.assert_called_once()
+    assert parallel == _map_model_stats(paths, {})
+    assert parallel[0] and "m.0" in parallel[0]
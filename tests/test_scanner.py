@@ -0,0 +1,103 @@
+import os
+from pathlib import Path
+
+from akaidoo.scanner import scan_addon_files, scan_directory_files, walk_files
+
+
+def test_walk_files_filters_suffix_and_skipped_dirs(tmp_path: Path):
+    """walk_files recurses, filters by suffix and never enters skipped dirs."""
+    (tmp_path / "models" / "sub").mkdir(parents=True)
+    (tmp_path / "models" / "__pycache__").mkdir()
+    (tmp_path / "models" / "a.py").write_text("a = 1\n")
+    (tmp_path / "models" / "sub" / "b.py").write_text("b = 1\n")
+    (tmp_path / "models" / "sub" / "c.xml").write_text("<odoo/>\n")
+    (tmp_path / "models" / "__pycache__" / "a.py").write_text("")
+
+    found = {
+        Path(p).relative_to(tmp_path).as_posix()
+        for p in walk_files(tmp_path, ".py", ("__pycache__",))
+    }
+    assert found == {"models/a.py", "models/sub/b.py"}
+
+    all_files = {Path(p).name for p in walk_files(tmp_path)}
+    assert all_files == {"a.py", "b.py", "c.xml"}
+
+
+def test_walk_files_missing_root(tmp_path: Path):
+    assert list(walk_files(tmp_path / "missing")) == []
+
+
+def test_scan_directory_files_skips_noise(tmp_path: Path):
+    (tmp_path / "pkg" / "i18n").mkdir(parents=True)
+    (tmp_path / "pkg" / "__pycache__").mkdir()
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "pkg" / ".hidden").mkdir()
+    (tmp_path / "README.md").write_text("readme\n")
+    (tmp_path / ".env").write_text("")
+    (tmp_path / ".git" / "config").write_text("")
+    (tmp_path / "pkg" / "mod.py").write_text("x = 1\n")
+    (tmp_path / "pkg" / "logo.PNG").write_bytes(b"")
+    (tmp_path / "pkg" / "i18n" / "fr.po").write_text("")
+    (tmp_path / "pkg" / "__pycache__" / "mod.pyc").write_bytes(b"")
+    (tmp_path / "pkg" / ".hidden" / "kept.txt").write_text("")
+
+    found = {p.relative_to(tmp_path).as_posix() for p in scan_directory_files(tmp_path)}
+    assert found == {"README.md", "pkg/mod.py", "pkg/.hidden/kept.txt"}
+
+
+def test_scan_addon_files_include_rules(tmp_path: Path):
+    addon_dir = tmp_path / "my_addon"
+    for rel in (
+        "__manifest__.py",
+        "models/partner.py",
+        "models/views/nested.xml",
+        "views/partner.xml",
+        "wizard/wiz.py",
+        "data/big.csv",
+        "static/src/app.js",
+        "tests/test_partner.py",
+    ):
+        path = addon_dir / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x = 1\n")
+
+    result = scan_addon_files(
+        addon_dir, "my_addon", {"my_addon"}, {"model", "view"}, set()
+    )
+    found = {p.relative_to(addon_dir.resolve()).as_posix() for p in result.found_files}
+    assert found == {
+        "__manifest__.py",
+        "models/partner.py",
+        "models/views/nested.xml",
+        "views/partner.xml",
+    }
+
+
+def test_scan_directory_files_keeps_rglob_pre_order(tmp_path: Path):
+    """A directory's files come before its sub-directories, walked in order."""
+    for rel in (
+        "top.txt",
+        "pkg/mod.py",
+        "pkg/s1/x.py",
+        "pkg/s1/deep/z.py",
+        "pkg/s2/y.py",
+        "pkg/s3/w.py",
+        "other/o.py",
+    ):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+
+    def pre_order(directory: Path):
+        # Same listing order as os.scandir
+        entries = [directory / name for name in os.listdir(directory)]
+        files = [entry for entry in entries if entry.is_file()]
+        for entry in entries:
+            if entry.is_dir():
+                files.extend(pre_order(entry))
+        return files
+
+    assert scan_directory_files(tmp_path) == pre_order(tmp_path)
+    assert [Path(p) for p in walk_files(tmp_path / "pkg")] == pre_order(
+        tmp_path / "pkg"
+    )
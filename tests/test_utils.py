@@ -1,4 +1,4 @@
-from akaidoo.utils import get_model_relations
+from akaidoo.utils import get_model_relations, read_text_cached, resolve_path
 
 
 def test_get_model_relations():
@@ -42,3 +42,33 @@ class Delegation(models.Model):
     assert "my.mixin" in relations  # Abstract models should be picked up
     assert "delegated.model" in relations
     assert relations["delegated.model"]["parents"] == {"parent.model"}
+
+
+def test_read_text_cached_reuses_texts_of_one_cache(tmp_path):
+    path = tmp_path / "a.py"
+    path.write_text("a = 1\n")
+    cache = {}
+    assert read_text_cached(path, cache) == "a = 1\n"
+
+    path.write_text("a = 22\n")
+    # Same resolution (cache): the text read first is reused
+    assert read_text_cached(str(path), cache) == "a = 1\n"
+    # Another resolution, or no cache at all, reads the file again
+    assert read_text_cached(path, {}) == "a = 22\n"
+    assert read_text_cached(path) == "a = 22\n"
+
+
+def test_resolve_path_follows_symlinks(tmp_path):
+    target = tmp_path / "target.py"
+    target.write_text("")
+    link = tmp_path / "link.py"
+    link.symlink_to(target)
+    assert resolve_path(link) == target.resolve()
+    cache = {}
+    assert resolve_path(link, cache) is resolve_path(link, cache)
+    # Another context, or no cache at all, sees a retargeted link
+    link.unlink()
+    link.symlink_to(tmp_path)
+    assert resolve_path(link, cache) == target.resolve()
+    assert resolve_path(link, {}) == tmp_path.resolve()
+    assert resolve_path(link) == tmp_path.resolve()